@@ -0,0 +1,211 @@
+"""크롤러 성능 측정 스크립트
+
+사용법:
+    python bench.py extract --cards 600
+    python bench.py load "https://www.11st.co.kr/page/martplus/category?dispCtgr2No=1361105&dispCtgr3No=1361108"
+    python bench.py xlsx --rows 20000 --images 200
+    python bench.py xlsx --rows 5000 --images 5000 --convert
+"""
+import os
+import sys
+import time
+import json
+import asyncio
+import argparse
+import tempfile
+import subprocess
+
+from playwright.async_api import async_playwright
+
+from main import (CrawlerThread, ExportThread, PILImage, shutdown_process_pool, BLOCK_PROFILES,
+                  CARD_ANCHOR_XPATH, NetworkStats, install_resource_blocking)
+
+
+EXPORT_ENGINES = ('openpyxl', 'xlsxwriter')
+
+
+def make_category_html(card_count):
+    """11번가 카테고리 페이지와 같은 구조의 상품 카드 HTML 생성"""
+    cards = []
+    for i in range(card_count):
+        cards.append(f"""
+<li>
+  <div class="c-card-item">
+    <a class="c-card-item__anchor" href="https://www.11st.co.kr/products/{1000000 + i}"
+       data-log-body='{{"last_discount_price":"{9900 + i}"}}'>
+      <span class="sr-only">벤치마크 상품 {i}</span>
+    </a>
+    <div class="c-card-item__info">
+      <strong class="c-card-item__price">{9900 + i:,}</strong>
+    </div>
+    <img src="" data-src="https://cdn.011st.com/11src/product/{i}.jpg">
+  </div>
+</li>""")
+    return f"<html><body><ul>{''.join(cards)}</ul></body></html>"
+
+
+async def bench_extract(card_count, repeat):
+    crawler = CrawlerThread("about:blank")
+    html = make_category_html(card_count)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page()
+        await page.set_content(html)
+
+        for label, extract in (("요소별", crawler.extract_products_per_element),
+                               ("일괄", crawler.extract_products)):
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                products = await extract(page)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            print(f"{label:>4}: {len(products)}개 / {best:.3f}s "
+                  f"({len(products) / best:,.0f} cards/sec)")
+
+        await browser.close()
+
+
+async def bench_load(url, profiles, repeat):
+    """차단 프로필별 페이지 로딩 시간 (같은 컨텍스트에서 첫 로딩과 캐시가 찬 재로딩을 따로 측정)"""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        for profile in profiles:
+            context = await browser.new_context()
+            stats = NetworkStats()
+            times = []
+            for _ in range(repeat):
+                page = await context.new_page()
+                await install_resource_blocking(page, profile, stats)
+                start = time.perf_counter()
+                await page.goto(url, timeout=60000)
+                await page.wait_for_selector(CARD_ANCHOR_XPATH, timeout=30000)
+                times.append(time.perf_counter() - start)
+                await page.close()
+            await context.close()
+            warm = times[1:] or times
+            print(f"{profile:>8}: 첫 로딩 {times[0]:.2f}s / 재로딩 평균 {sum(warm) / len(warm):.2f}s")
+            print(f"{'':>10}{stats.summary()}")
+        await browser.close()
+
+
+def make_export_products(row_count, image_count, work_dir, convert=False):
+    """엑셀 내보내기용 상품 목록 생성 (서로 다른 썸네일 image_count장을 돌려 씀)
+
+    convert=True면 표시용 썸네일 없이 투명 PNG 원본만 두어 내보내기 때 이미지 변환이 일어나게 한다.
+    """
+    images = []
+    for i in range(image_count):
+        color = (i * 37 % 256, i * 91 % 256, i * 53 % 256)
+        if convert:
+            path = os.path.join(work_dir, f"{i}.png")
+            PILImage.effect_noise((300, 300), 64).convert('RGBA').save(path)
+        else:
+            path = os.path.join(work_dir, f"{i}.display.jpg")
+            PILImage.new('RGB', (200, 200), color).save(path, 'JPEG', quality=85)
+        images.append(path)
+
+    products = []
+    for i in range(row_count):
+        image = images[i % image_count] if images else ''
+        products.append({
+            'name': f"벤치마크 상품 {i}",
+            'price': f"{9900 + i:,}원",
+            'thumbnail': f"https://cdn.011st.com/11src/product/{i}.jpg",
+            'thumbnail_local': image,
+            'thumbnail_display': '' if convert else image,
+            'category': '1361108',
+        })
+    return products
+
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 RSS (MB, 유닉스 전용)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # 리눅스는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def bench_xlsx_engine(engine, row_count, image_count, convert):
+    """한 엔진으로 내보내기 한 번 실행하고 결과를 JSON 한 줄로 출력 (하위 프로세스에서 실행)"""
+    with tempfile.TemporaryDirectory() as work_dir:
+        products = make_export_products(row_count, image_count, work_dir, convert)
+        filename = os.path.join(work_dir, 'export.xlsx')
+        exporter = ExportThread(products, filename, engine=engine)
+        errors = []
+        exporter.error.connect(errors.append)
+
+        baseline = peak_rss_mb()
+        start = time.perf_counter()
+        exporter.run()
+        elapsed = time.perf_counter() - start
+
+        shutdown_process_pool()
+        print(json.dumps({
+            'engine': engine,
+            'seconds': elapsed,
+            'peak_rss_mb': peak_rss_mb(),
+            'baseline_rss_mb': baseline,
+            'file_mb': os.path.getsize(filename) / (1024 * 1024) if os.path.exists(filename) else 0,
+            'error': errors[0] if errors else None,
+        }))
+
+
+def bench_xlsx(row_count, image_count, convert):
+    """엔진별로 별도 프로세스를 띄워 최대 메모리가 서로 섞이지 않게 측정"""
+    for engine in EXPORT_ENGINES:
+        output = subprocess.run(
+            [sys.executable, __file__, 'xlsx', '--rows', str(row_count),
+             '--images', str(image_count), '--engine', engine] + (['--convert'] if convert else []),
+            check=True, capture_output=True, text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        if result['error']:
+            print(f"{engine:>10}: 오류 - {result['error']}")
+            continue
+        rss = (f"최대 RSS {result['peak_rss_mb']:.0f}MB (시작 {result['baseline_rss_mb']:.0f}MB)"
+               if result['peak_rss_mb'] is not None else "최대 RSS 측정 불가")
+        print(f"{engine:>10}: {row_count:,}행 / {result['seconds']:.2f}s "
+              f"({row_count / result['seconds']:,.0f} rows/sec) / {rss} / "
+              f"파일 {result['file_mb']:.1f}MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="11번가 크롤러 벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    extract = sub.add_parser("extract", help="상품 카드 추출 속도 (요소별 vs 일괄)")
+    extract.add_argument("--cards", type=int, default=600)
+    extract.add_argument("--repeat", type=int, default=3)
+
+    load = sub.add_parser("load", help="리소스 차단 프로필별 페이지 로딩 시간")
+    load.add_argument("url")
+    load.add_argument("--profiles", nargs="+", choices=list(BLOCK_PROFILES), default=list(BLOCK_PROFILES))
+    load.add_argument("--repeat", type=int, default=3)
+
+    xlsx = sub.add_parser("xlsx", help="엑셀 내보내기 시간과 최대 메모리 (openpyxl vs xlsxwriter)")
+    xlsx.add_argument("--rows", type=int, default=20000)
+    xlsx.add_argument("--images", type=int, default=200, help="서로 다른 썸네일 수 (0이면 이미지 없음)")
+    xlsx.add_argument("--engine", choices=EXPORT_ENGINES, help="한 엔진만 현재 프로세스에서 실행")
+    xlsx.add_argument("--convert", action="store_true", help="표시용 썸네일 없이 원본을 내보내기 때 변환")
+
+    args = parser.parse_args()
+
+    if args.command == "extract":
+        asyncio.run(bench_extract(args.cards, args.repeat))
+    elif args.command == "load":
+        asyncio.run(bench_load(args.url, args.profiles, args.repeat))
+    elif args.command == "xlsx":
+        if args.engine:
+            bench_xlsx_engine(args.engine, args.rows, args.images, args.convert)
+        else:
+            bench_xlsx(args.rows, args.images, args.convert)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
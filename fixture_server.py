@@ -0,0 +1,190 @@
+"""녹화한 목록 API 응답을 재생하는 로컬 픽스처 서버 (오프라인 테스트용)
+
+사용법:
+    python fixture_server.py record "https://www.11st.co.kr/page/martplus/category?dispCtgr2No=1361105&dispCtgr3No=1361108" --out fixtures/1361108
+    python fixture_server.py serve fixtures/1361108 --port 8765
+    python fixture_server.py serve fixtures/1361108 --no-api   # DOM 대체 경로 확인용
+
+serve 실행 후 http://127.0.0.1:8765/page/martplus/category?dispCtgr3No=1361108 을 크롤링하면
+녹화한 응답이 /api/fixture/listing?page=N 으로 순서대로 재생되고, 스크롤할 때마다 다음 페이지가 붙는다.
+"""
+import os
+import sys
+import json
+import asyncio
+import argparse
+from html import escape
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from playwright.async_api import async_playwright
+
+from main import CrawlerThread, CARD_ANCHOR_XPATH, is_listing_response, parse_listing_json
+
+
+SHELL_HTML = """<html><body>
+<ul id="cards">{cards}</ul>
+<script>
+let nextPage = 0;
+let loading = false;
+async function loadNext() {{
+    if (loading || nextPage < 0) return;
+    loading = true;
+    const response = await fetch('/api/fixture/listing?page=' + nextPage);
+    if (response.ok) {{
+        await response.json();
+        const html = await (await fetch('/fixture/cards?page=' + nextPage)).text();
+        document.getElementById('cards').insertAdjacentHTML('beforeend', html);
+        nextPage++;
+    }} else {{
+        nextPage = -1;
+    }}
+    loading = false;
+}}
+window.addEventListener('scroll', () => {{
+    if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 400) loadNext();
+}});
+{autoload}
+</script>
+</body></html>"""
+
+
+def card_html(product):
+    """11번가 카테고리 페이지와 같은 구조의 상품 카드 HTML"""
+    return f"""
+<li>
+  <div class="c-card-item">
+    <a class="c-card-item__anchor" href="{escape(product['url'])}">
+      <span class="sr-only">{escape(product['name'])}</span>
+    </a>
+    <div class="c-card-item__info">
+      <strong class="c-card-item__price">{escape(product['price'])}</strong>
+    </div>
+    <img src="" data-src="{escape(product['thumbnail'])}">
+  </div>
+</li>"""
+
+
+def load_fixtures(fixture_dir):
+    with open(os.path.join(fixture_dir, 'responses.json'), encoding='utf-8') as f:
+        manifest = json.load(f)
+    bodies = []
+    for entry in manifest:
+        with open(os.path.join(fixture_dir, entry['file']), 'rb') as f:
+            bodies.append(f.read())
+    return bodies
+
+
+def make_handler(bodies, serve_api):
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def send_body(self, status, content_type, body):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def page_index(self):
+            query = parse_qs(urlparse(self.path).query)
+            page = int(query.get('page', ['0'])[0])
+            return page if 0 <= page < len(bodies) else None
+
+        def do_GET(self):
+            path = urlparse(self.path).path
+
+            if path.startswith('/page/'):
+                if serve_api:
+                    html = SHELL_HTML.format(cards='', autoload='loadNext();')
+                else:
+                    cards = ''.join(card_html(product) for body in bodies
+                                    for product in parse_listing_json(json.loads(body)))
+                    html = SHELL_HTML.format(cards=cards, autoload='nextPage = -1;')
+                self.send_body(200, 'text/html; charset=utf-8', html.encode('utf-8'))
+
+            elif path == '/api/fixture/listing' and serve_api:
+                page = self.page_index()
+                if page is None:
+                    self.send_body(404, 'application/json', b'{}')
+                else:
+                    self.send_body(200, 'application/json; charset=utf-8', bodies[page])
+
+            elif path == '/fixture/cards':
+                page = self.page_index()
+                products = parse_listing_json(json.loads(bodies[page])) if page is not None else []
+                html = ''.join(card_html(product) for product in products)
+                self.send_body(200, 'text/html; charset=utf-8', html.encode('utf-8'))
+
+            else:
+                self.send_body(404, 'text/plain', b'not found')
+
+        def log_message(self, format, *args):
+            pass
+
+    return FixtureHandler
+
+
+async def record(url, out_dir):
+    """실제 카테고리 페이지를 스크롤하며 목록 API 응답 본문을 out_dir에 저장"""
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = []
+    pending = set()
+
+    async def save(response):
+        body = await response.body()
+        filename = f"{len(manifest):03d}.json"
+        manifest.append({'file': filename, 'url': response.url})
+        with open(os.path.join(out_dir, filename), 'wb') as f:
+            f.write(body)
+
+    def on_response(response):
+        if is_listing_response(response):
+            task = asyncio.ensure_future(save(response))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page()
+        page.on("response", on_response)
+        await page.goto(url, timeout=60000)
+        await page.wait_for_selector(CARD_ANCHOR_XPATH, timeout=30000)
+        await CrawlerThread(url).scroll_until_stable(page, wait_images=False)
+        while pending:
+            await asyncio.gather(*list(pending), return_exceptions=True)
+        await browser.close()
+
+    with open(os.path.join(out_dir, 'responses.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    print(f"목록 응답 {len(manifest)}건 저장: {out_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="11번가 목록 API 픽스처 녹화/재생 서버")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="실제 페이지의 목록 API 응답 녹화")
+    rec.add_argument("url")
+    rec.add_argument("--out", required=True)
+
+    serve = sub.add_parser("serve", help="녹화한 응답 재생")
+    serve.add_argument("fixture_dir")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--no-api", action="store_true", help="카드를 HTML에 바로 넣고 목록 API는 제공하지 않음")
+
+    args = parser.parse_args()
+
+    if args.command == "record":
+        asyncio.run(record(args.url, args.out))
+    else:
+        bodies = load_fixtures(args.fixture_dir)
+        server = ThreadingHTTPServer(('127.0.0.1', args.port),
+                                     make_handler(bodies, serve_api=not args.no_api))
+        print(f"픽스처 서버 실행 중: http://127.0.0.1:{args.port}/page/martplus/category (응답 {len(bodies)}건)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,29 +1,1483 @@
 import sys
 import os
+import io
 import asyncio
+import json
+import threading
+import time
+import re
+import random
+import hashlib
+import tempfile
+import shutil
+import unicodedata
+import multiprocessing
+from bisect import bisect_left
+from collections import Counter, OrderedDict, deque
+from contextlib import asynccontextmanager, nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlparse, urlunparse, parse_qs, parse_qsl, urlencode
 import requests
+import httpx
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from PIL import Image as PILImage
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
-                             QHBoxLayout, QLabel, QLineEdit, QPushButton,
-                             QTextEdit, QTableWidget, QTableWidgetItem,
-                             QProgressBar, QFileDialog, QMessageBox)
-from PyQt6.QtCore import QThread, pyqtSignal, Qt
+                             QHBoxLayout, QLabel, QPushButton, QPlainTextEdit,
+                             QTableView, QHeaderView, QSpinBox, QLineEdit,
+                             QProgressBar, QFileDialog, QMessageBox, QComboBox, QCheckBox)
+from PyQt6.QtCore import (QThread, QTimer, pyqtSignal, Qt, QAbstractTableModel,
+                          QAbstractProxyModel, QModelIndex, QObject, QSize)
+from PyQt6.QtGui import QImage, QImageReader, QPixmap
 from playwright.async_api import async_playwright
+from lxml import html as lxml_html
 import openpyxl
+import xlsxwriter
 from openpyxl.styles import Font, Alignment
 from openpyxl.drawing.image import Image as XLImage
+from xlsxwriter.worksheet import Worksheet as XLSXWorksheet
+
+
+CARD_ANCHOR_XPATH = "//a[contains(@class, 'c-card-item__anchor')]"
+CARD_ANCHOR_CSS = "a[class*='c-card-item__anchor']"
+
+# 모든 상품 카드의 필드를 브라우저 안에서 한 번에 읽어 단순 레코드 목록으로 반환
+EXTRACT_CARDS_JS = """
+(anchorXPath) => {
+    const first = (ctx, xpath) => document.evaluate(
+        xpath, ctx, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    const snapshot = document.evaluate(
+        anchorXPath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const records = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) {
+        const link = snapshot.snapshotItem(i);
+        const parent = link.parentElement || link;
+        const nameElem = first(link, ".//span[@class='sr-only']");
+        const priceElem = first(parent, ".//strong[contains(@class, 'price')]");
+        const img = first(parent, ".//img");
+        records.push({
+            url: link.getAttribute('href'),
+            data_log: link.getAttribute('data-log-body'),
+            name: nameElem ? nameElem.innerText : null,
+            price: priceElem ? priceElem.innerText : null,
+            has_img: !!img,
+            src: img ? img.getAttribute('src') : null,
+            data_src: img ? img.getAttribute('data-src') : null,
+            data_original: img ? img.getAttribute('data-original') : null,
+        });
+    }
+    return records;
+}
+"""
+
+
+# 스크롤 엔진용 페이지 내 관찰자 설치: MutationObserver로 상품 카드 추가를,
+# IntersectionObserver와 load/error 이벤트로 상품 카드 안의 로딩 중인 lazy 이미지를 추적
+# (배너/아이콘/광고 이미지는 추적하지 않음)
+SCROLL_OBSERVER_JS = """
+(cardSelector) => {
+    if (window.__crawlScroll) return;
+    const state = {pending: new Map(), stalled: new WeakSet(), waiters: []};
+    const notify = () => {
+        const waiters = state.waiters;
+        state.waiters = [];
+        waiters.forEach(wake => wake());
+    };
+    const settle = (img) => { if (state.pending.delete(img)) notify(); };
+    // 카드 앵커 자신이나 앵커를 직접 자식으로 둔 카드 컨테이너 안의 이미지만 카드 이미지로 봄
+    const inCard = (img) => {
+        for (let el = img.parentElement, depth = 0; el && el !== document.body && depth < 6;
+             el = el.parentElement, depth++) {
+            if (el.matches(cardSelector) || el.querySelector(':scope > ' + cardSelector)) return true;
+        }
+        return false;
+    };
+    const track = (img) => {
+        if (img.tagName !== 'IMG' || img.complete || state.pending.has(img) || state.stalled.has(img)) return;
+        if (!inCard(img)) return;
+        state.pending.set(img, performance.now());
+        img.addEventListener('load', () => settle(img), {once: true});
+        img.addEventListener('error', () => settle(img), {once: true});
+    };
+    const intersection = new IntersectionObserver((entries) => {
+        entries.forEach(entry => { if (entry.isIntersecting) track(entry.target); });
+    }, {rootMargin: '200px'});
+    const observeCards = (cards) => cards.forEach(card => {
+        const container = card.parentElement || card;
+        container.querySelectorAll('img').forEach(img => intersection.observe(img));
+    });
+    const watch = (node) => {
+        if (node.nodeType !== Node.ELEMENT_NODE) return;
+        if (node.tagName === 'IMG') {
+            if (inCard(node)) intersection.observe(node);
+            return;
+        }
+        if (node.matches(cardSelector)) observeCards([node]);
+        observeCards(node.querySelectorAll(cardSelector));
+    };
+    watch(document.body);
+    const hasCard = (node) => node.nodeType === Node.ELEMENT_NODE
+        && (node.matches(cardSelector) || node.querySelector(cardSelector) !== null);
+    new MutationObserver((mutations) => {
+        let cardsAdded = false;
+        for (const mutation of mutations) {
+            if (mutation.type === 'attributes') {
+                track(mutation.target);
+                continue;
+            }
+            mutation.addedNodes.forEach(node => {
+                watch(node);
+                cardsAdded = cardsAdded || hasCard(node);
+            });
+        }
+        if (cardsAdded) notify();
+    }).observe(document.body, {childList: true, subtree: true, attributes: true,
+                               attributeFilter: ['src', 'srcset']});
+    const countCards = () => document.querySelectorAll(cardSelector).length;
+    window.__crawlScroll = {state, countCards};
+}
+"""
+
+# 한 화면만큼 아래로 스크롤한 뒤 카드 추가나 이미지 로딩 완료(없으면 idleMs)까지 기다려 상태 반환
+# (stallMs보다 오래 로딩 중인 이미지는 멈춘 요청으로 보고 더 기다리지 않음)
+SCROLL_STEP_JS = """
+async ({idleMs, stallMs}) => {
+    const {state, countCards} = window.__crawlScroll;
+    window.scrollBy(0, window.innerHeight);
+    await new Promise(resolve => {
+        const timer = setTimeout(resolve, idleMs);
+        state.waiters.push(() => { clearTimeout(timer); resolve(); });
+    });
+    const now = performance.now();
+    let stalled = 0;
+    for (const [img, since] of state.pending) {
+        if (!img.isConnected || img.complete) {
+            state.pending.delete(img);
+        } else if (now - since > stallMs) {
+            state.pending.delete(img);
+            state.stalled.add(img);
+            stalled++;
+        }
+    }
+    const scroller = document.scrollingElement || document.documentElement;
+    return {
+        cards: countCards(),
+        pending: state.pending.size,
+        stalled: stalled,
+        position: Math.round(window.scrollY + window.innerHeight),
+        height: scroller.scrollHeight,
+        atBottom: window.scrollY + window.innerHeight >= scroller.scrollHeight - 2,
+    };
+}
+"""
+
+
+# 크롤링 컨텍스트의 리소스 차단 프로필 (document/xhr/fetch/script/image는 DOM과 이미지 URL 유지를 위해 항상 허용)
+BLOCK_PROFILES = {
+    'off': {'resource_types': set(), 'block_trackers': False},
+    'default': {'resource_types': {'font', 'media'}, 'block_trackers': True},
+    'lean': {'resource_types': {'font', 'media', 'stylesheet', 'manifest', 'texttrack'},
+             'block_trackers': True},
+}
+
+# 차단할 서드파티 추적/광고 도메인 (하위 도메인 포함)
+TRACKER_DOMAINS = (
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'googlesyndication.com', 'googleadservices.com', 'facebook.net', 'facebook.com',
+    'criteo.com', 'criteo.net', 'adnxs.com', 'scorecardresearch.com', 'hotjar.com',
+    'mobon.net', 'dable.io', 'adsrvr.org', 'clarity.ms', 'ads-partners.coupang.com',
+)
+
+# 11번가 자체 도메인 (추적 도메인 차단 대상에서 제외)
+FIRST_PARTY_DOMAINS = ('11st.co.kr', '011st.com')
+
+# 리소스 유형별 차단 URL 패턴 (CDP Network.setBlockedURLs는 유형이 아닌 URL로만 거르므로 확장자 기준)
+RESOURCE_URL_PATTERNS = {
+    'font': ('*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'),
+    'media': ('*.mp4', '*.webm', '*.m3u8', '*.mp3', '*.ogg', '*.mov'),
+    'stylesheet': ('*.css',),
+    'manifest': ('*.webmanifest', '*/manifest.json'),
+    'texttrack': ('*.vtt',),
+}
+
+# 유형별 평균 응답 크기를 아직 관측하지 못했을 때 쓰는 추정치 (bytes)
+ESTIMATED_RESOURCE_BYTES = {
+    'font': 60000, 'media': 500000, 'stylesheet': 40000, 'script': 50000,
+    'manifest': 2000, 'texttrack': 5000, 'image': 20000,
+}
+
+
+def host_matches(host, domains):
+    return any(host == domain or host.endswith('.' + domain) for domain in domains)
+
+
+class NetworkStats:
+    """실행 단위 네트워크 차단 통계 (차단 요청 수, 절감 용량 추정, 로딩/스크롤 시간)"""
+
+    def __init__(self):
+        self.requests = 0
+        self.blocked = Counter()
+        self.observed_bytes = Counter()
+        self.observed_counts = Counter()
+        self.load_times = []
+        self.scroll_times = []
+
+    def record_request(self, request):
+        self.requests += 1
+
+    def record_blocked(self, resource_type):
+        self.blocked[resource_type] += 1
+
+    def record_response(self, response):
+        length = response.headers.get('content-length')
+        if length and length.isdigit():
+            resource_type = response.request.resource_type
+            self.observed_bytes[resource_type] += int(length)
+            self.observed_counts[resource_type] += 1
+
+    def estimated_bytes_saved(self):
+        total = 0
+        for resource_type, count in self.blocked.items():
+            if self.observed_counts[resource_type]:
+                average = self.observed_bytes[resource_type] / self.observed_counts[resource_type]
+            else:
+                average = ESTIMATED_RESOURCE_BYTES.get(resource_type, 10000)
+            total += average * count
+        return int(total)
+
+    def summary(self):
+        blocked_total = sum(self.blocked.values())
+        by_type = ", ".join(f"{t} {c}" for t, c in self.blocked.most_common())
+        text = (f"네트워크: 요청 {self.requests}건 중 {blocked_total}건 차단"
+                f"{f' ({by_type})' if by_type else ''}, "
+                f"약 {self.estimated_bytes_saved() / 1024:,.0f} KB 절감 (추정)")
+        if self.load_times:
+            text += f", 평균 로딩 {sum(self.load_times) / len(self.load_times):.1f}s"
+        if self.scroll_times:
+            text += f", 평균 스크롤 {sum(self.scroll_times) / len(self.scroll_times):.1f}s"
+        return text
+
+
+def blocked_url_patterns(profile):
+    """프로필이 차단하는 URL 패턴 목록 (쿼리 문자열이 붙은 주소도 포함)"""
+    rules = BLOCK_PROFILES[profile]
+    patterns = []
+    for resource_type in sorted(rules['resource_types']):
+        for pattern in RESOURCE_URL_PATTERNS.get(resource_type, ()):
+            patterns += [pattern, pattern + '?*']
+    if rules['block_trackers']:
+        for domain in TRACKER_DOMAINS:
+            if not host_matches(domain, FIRST_PARTY_DOMAINS):
+                patterns += [f'*://{domain}/*', f'*://*.{domain}/*']
+    return patterns
+
+
+async def install_resource_blocking(page, profile, stats):
+    """페이지에 리소스 차단 목록을 설치하고 통계를 stats에 기록
+
+    page.route는 요청마다 파이썬 콜백을 거치고 HTTP 캐시도 꺼서 풀에 둔 컨텍스트가 스크립트/CSS/이미지를
+    매번 다시 받게 되므로, 브라우저 안에서 거르는 CDP Network.setBlockedURLs를 쓴다.
+    """
+    patterns = blocked_url_patterns(profile)
+    if patterns:
+        cdp = await page.context.new_cdp_session(page)
+        await cdp.send('Network.enable')
+        await cdp.send('Network.setBlockedURLs', {'urls': patterns})
+
+    def on_request_failed(request):
+        if request.failure == 'net::ERR_BLOCKED_BY_CLIENT':
+            stats.record_blocked(request.resource_type)
+
+    page.on("request", stats.record_request)
+    page.on("requestfailed", on_request_failed)
+    page.on("response", stats.record_response)
+
+
+# 상품 목록 JSON을 돌려주는 API 응답 URL 패턴 (경로 기준, 로컬 픽스처 서버도 동일하게 매칭)
+LISTING_API_PATTERNS = (
+    re.compile(r"/api/.*(?:product|prd|item|goods|list)", re.IGNORECASE),
+    re.compile(r"/page/martplus/.*(?:ajax|api|json)", re.IGNORECASE),
+)
+
+# 목록 JSON의 상품 레코드 필드 후보 (앞쪽이 우선)
+JSON_ID_KEYS = ('prdNo', 'productNo', 'prdId', 'productId', 'goodsNo', 'id')
+JSON_NAME_KEYS = ('prdNm', 'productName', 'goodsNm', 'name', 'title')
+JSON_PRICE_KEYS = ('selPrc', 'sellPrice', 'salePrice', 'price', 'prc')
+JSON_DISCOUNT_KEYS = ('finalDscPrc', 'lastDiscountPrice', 'last_discount_price',
+                      'discountPrice', 'dscPrc', 'finalPrice')
+JSON_IMAGE_KEYS = ('imgUrl', 'imageUrl', 'prdImgUrl', 'thumbnailUrl', 'img', 'image', 'thumbnail')
+JSON_URL_KEYS = ('linkUrl', 'prdUrl', 'productUrl', 'url', 'link')
+
+
+def first_value(item, keys, types=None):
+    """keys 중 처음으로 값이 있는 필드 값 (types가 주어지면 그 타입의 값만)"""
+    for key in keys:
+        value = item.get(key)
+        if value in (None, '') or (types is not None and not isinstance(value, types)):
+            continue
+        return value
+    return None
+
+
+def format_price(value):
+    """숫자 가격을 화면 표기(12,900)와 같은 형식으로 변환"""
+    if isinstance(value, (int, float)):
+        return f"{int(value):,}"
+    return str(value) if value is not None else "N/A"
+
+
+def build_product_from_json(item):
+    """목록 API의 상품 레코드를 상품 dict로 변환 (상품 레코드가 아니면 None)"""
+    product_id = first_value(item, JSON_ID_KEYS, (str, int))
+    name = first_value(item, JSON_NAME_KEYS)
+    if product_id is None or not isinstance(name, str):
+        return None
+
+    price = first_value(item, JSON_PRICE_KEYS)
+    discount_price = first_value(item, JSON_DISCOUNT_KEYS)
+    # 이미지/URL 필드가 객체나 배열인 응답도 있으므로 문자열만 사용
+    image = first_value(item, JSON_IMAGE_KEYS, str)
+    # 카테고리/배너처럼 id와 이름만 있는 레코드는 제외
+    if price is None and discount_price is None and image is None:
+        return None
+
+    product = {}
+    product['url'] = first_value(item, JSON_URL_KEYS, str) or f"https://www.11st.co.kr/products/{product_id}"
+    product['name'] = name
+    product['price'] = format_price(discount_price if discount_price is not None else price)
+    product['thumbnail'] = image or "N/A"
+    product['registered_date'] = datetime.now().strftime("%Y-%m-%d")
+    product['product_id'] = str(product_id)
+    product['list_price'] = format_price(price)
+    product['discount_price'] = format_price(discount_price)
+
+    return product
+
+
+def parse_listing_json(data):
+    """목록 JSON 전체를 훑어 상품 레코드 목록 추출"""
+    products = []
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            for item in node:
+                product = build_product_from_json(item) if isinstance(item, dict) else None
+                if product:
+                    products.append(product)
+                else:
+                    stack.append(item)
+    return products
+
+
+def is_listing_response(response):
+    if response.status != 200:
+        return False
+    if 'json' not in response.headers.get('content-type', ''):
+        return False
+    parsed = urlparse(response.url)
+    target = f"{parsed.path}?{parsed.query}"
+    return any(pattern.search(target) for pattern in LISTING_API_PATTERNS)
+
+
+class ListingCapture:
+    """page.on('response')로 목록 API 응답을 받아 상품 레코드를 모음"""
+
+    def __init__(self, page):
+        self.tasks = set()
+        self.responses = 0
+        self.products = []
+        self.seen_ids = set()
+        page.on("response", self.on_response)
+
+    def on_response(self, response):
+        if is_listing_response(response):
+            task = asyncio.ensure_future(self.parse(response))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def parse(self, response):
+        try:
+            data = await response.json()
+        except Exception:
+            return
+        products = parse_listing_json(data)
+        if products:
+            self.responses += 1
+        for product in products:
+            if product['product_id'] not in self.seen_ids:
+                self.seen_ids.add(product['product_id'])
+                self.products.append(product)
+
+    async def drain(self):
+        """진행 중인 응답 파싱이 끝날 때까지 대기 후 수집된 상품 반환"""
+        while self.tasks:
+            await asyncio.gather(*list(self.tasks), return_exceptions=True)
+        return self.products
+
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def http_session():
+    """keep-alive 연결을 재사용하는 공용 HTTP 세션"""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers['User-Agent'] = USER_AGENT
+            _http_session = session
+        return _http_session
+
+
+# 페이지에 적힌 전체 상품 수 (스크립트의 JSON 값 또는 "총 N개" 표기)
+TOTAL_COUNT_RE = re.compile(
+    r'["\']?(?:totalCount|totalCnt|totCnt|total_count|totalProductCount)["\']?\s*[:=]\s*["\']?(\d[\d,]*)'
+    r'|총\s*(\d[\d,]*)\s*개')
+
+# 다음 페이지나 더보기가 있다는 표시
+MORE_MARKER_XPATH = (
+    "//a[@rel='next'] | //link[@rel='next'] | //*[contains(@class, 'pagination')]"
+    " | //*[contains(@class, 'btn_more') or contains(@class, 'c-more') or contains(@class, 'load-more')]"
+)
+
+# 무한 스크롤 목록이 첫 묶음으로 내려주는 흔한 개수 (전체 수 표기가 없을 때 잘린 목록으로 간주)
+COMMON_PAGE_SIZES = {20, 24, 30, 40, 48, 50, 60, 80, 100, 120}
+
+
+def listing_truncation(html, tree, count):
+    """HTML에 목록의 첫 묶음만 들어 있으면 이유를, 전체가 들어 있으면 None 반환
+
+    페이지의 전체 수 표기는 장바구니 수처럼 목록과 무관한 값일 수 있으므로 카드 수보다 클 때만
+    잘림의 근거로 쓰고, 작거나 같으면 더보기 표시와 페이지 크기 검사를 계속한다.
+    """
+    totals = [int((match.group(1) or match.group(2)).replace(',', ''))
+              for match in TOTAL_COUNT_RE.finditer(html)]
+    if totals and max(totals) > count:
+        return f"전체 {max(totals)}개 중 {count}개만 포함"
+    if tree.xpath(MORE_MARKER_XPATH):
+        return "다음 페이지/더보기 표시 있음"
+    if count in COMMON_PAGE_SIZES:
+        return f"상품 수가 한 페이지 크기({count}개)와 같음"
+    return None
+
+
+def extract_listing_from_html(html):
+    """서버 렌더링된 HTML에서 extract_products와 같은 규칙으로 상품 카드를 추출하고
+    목록 잘림 이유(listing_truncation)와 함께 반환"""
+    tree = lxml_html.fromstring(html)
+    products = []
+    for link in tree.xpath(CARD_ANCHOR_XPATH):
+        parent = link.getparent() if link.getparent() is not None else link
+        name_elems = link.xpath(".//span[@class='sr-only']")
+        price_elems = parent.xpath(".//strong[contains(@class, 'price')]")
+        img_elems = parent.xpath(".//img")
+        img = img_elems[0] if img_elems else None
+        products.append(build_product({
+            'url': link.get('href'),
+            'data_log': link.get('data-log-body'),
+            'name': " ".join(name_elems[0].text_content().split()) if name_elems else None,
+            'price': " ".join(price_elems[0].text_content().split()) if price_elems else None,
+            'has_img': img is not None,
+            'src': img.get('src') if img is not None else None,
+            'data_src': img.get('data-src') if img is not None else None,
+            'data_original': img.get('data-original') if img is not None else None,
+        }))
+    return products, listing_truncation(html, tree, len(products))
+
+
+def is_complete_listing(products, max_missing_name=0.1, max_missing_price=0.2,
+                        max_missing_thumbnail=0.5):
+    """HTTP 경로 결과가 브라우저 경로를 대신할 만큼 온전한지 판단"""
+    if not products:
+        return False
+    total = len(products)
+    missing_name = sum(1 for p in products if p['name'] == "N/A") / total
+    missing_price = sum(1 for p in products if p['price'] == "N/A") / total
+    missing_thumbnail = sum(1 for p in products if not p['thumbnail'] or p['thumbnail'] == "N/A") / total
+    return (missing_name <= max_missing_name and missing_price <= max_missing_price
+            and missing_thumbnail <= max_missing_thumbnail)
+
+
+def fetch_products_over_http(url):
+    """브라우저 없이 HTML을 받아 (상품 목록, 목록 잘림 이유) 반환 (동기, 실행기 스레드에서 호출)"""
+    response = http_session().get(url, timeout=15)
+    response.raise_for_status()
+    # charset이 없으면 requests는 ISO-8859-1로 간주하므로 UTF-8로 디코딩
+    if 'charset' in response.headers.get('content-type', '').lower():
+        encoding = response.encoding
+    else:
+        encoding = 'utf-8'
+    return extract_listing_from_html(response.content.decode(encoding, errors='replace'))
+
+
+def normalize_image_url(url):
+    """상대/프로토콜 생략 이미지 URL을 절대 https URL로 변환"""
+    if url.startswith('//'):
+        return 'https:' + url
+    if url.startswith('/'):
+        return 'https://www.11st.co.kr' + url
+    return url
+
+
+def canonical_image_url(url):
+    """캐시 키로 쓰는 정규화 URL (https, 소문자 호스트, 정렬된 쿼리, fragment 제거)"""
+    parsed = urlparse(normalize_image_url(url))
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return urlunparse(('https', parsed.netloc.lower(), parsed.path, '', query, ''))
+
+
+def write_atomic(path, data):
+    """임시 파일에 쓴 뒤 rename으로 교체 (중간에 실패해도 깨진 파일이 남지 않음)"""
+    directory = os.path.dirname(path)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+# 11번가 이미지 CDN 리사이즈 변형 (/11dims/resize/WxH/quality/Q/11src/...) 요청 설정
+CDN_IMAGE_DOMAINS = ('011st.com',)
+THUMBNAIL_FETCH_SIZE = 200
+THUMBNAIL_FETCH_QUALITY = 75
+CDN_RESIZE_RE = re.compile(r"/resize/(\d+)x(\d+)")
+
+
+def thumbnail_variant_url(url, size=THUMBNAIL_FETCH_SIZE, quality=THUMBNAIL_FETCH_QUALITY):
+    """표시 크기에 가까운 CDN 리사이즈 URL로 변환 (해당 없거나 이미 더 작으면 원래 URL)"""
+    parsed = urlparse(url)
+    if not host_matches(parsed.hostname or '', CDN_IMAGE_DOMAINS):
+        return url
+
+    path = parsed.path
+    if path.startswith('/11dims/'):
+        match = CDN_RESIZE_RE.search(path)
+        if not match or max(int(match.group(1)), int(match.group(2))) <= size:
+            return url
+        path = CDN_RESIZE_RE.sub(f"/resize/{size}x{size}", path, count=1)
+    elif path.startswith('/11src/'):
+        path = f"/11dims/resize/{size}x{size}/quality/{quality}{path}"
+    else:
+        return url
+
+    return urlunparse(parsed._replace(path=path))
+
+
+# 엑셀/화면 표시용 썸네일 최대 크기 (엑셀에는 100x100으로 표시)
+DISPLAY_THUMBNAIL_SIZE = (200, 200)
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+def process_pool():
+    """이미지 변환용 공용 프로세스 풀
+
+    Qt/브라우저 스레드가 이미 돌고 있는 프로세스를 fork하면 자식이 멈출 수 있으므로
+    모든 플랫폼에서 Windows와 같은 spawn 방식으로 작업 프로세스를 띄운다.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn'))
+        return _process_pool
+
+
+def shutdown_process_pool():
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False, cancel_futures=True)
+            _process_pool = None
+
+
+def to_rgb(pil_img):
+    """투명 배경(RGBA/LA/P)은 흰 배경에 합성하고 나머지는 RGB로 변환"""
+    if pil_img.mode in ('RGBA', 'LA', 'P'):
+        # 흰 배경으로 변환
+        background = PILImage.new('RGB', pil_img.size, (255, 255, 255))
+        if pil_img.mode == 'P':
+            pil_img = pil_img.convert('RGBA')
+        background.paste(pil_img, mask=pil_img.split()[-1] if pil_img.mode == 'RGBA' else None)
+        return background
+    if pil_img.mode != 'RGB':
+        return pil_img.convert('RGB')
+    return pil_img
+
+
+def display_path_for(path):
+    """원본 썸네일 옆에 두는 표시용 RGB JPEG 경로 (<해시>.display.jpg)"""
+    return os.path.splitext(path)[0] + '.display.jpg'
+
+
+def normalize_thumbnail(src_path, dst_path, size=DISPLAY_THUMBNAIL_SIZE):
+    """원본 썸네일을 표시용 RGB JPEG로 변환해 저장 (프로세스 풀에서 실행)"""
+    with PILImage.open(src_path) as pil_img:
+        pil_img = to_rgb(pil_img)
+        pil_img.thumbnail(size)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(dst_path), prefix='.tmp_')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pil_img.save(f, 'JPEG', quality=90)
+            os.replace(temp_path, dst_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    return dst_path
+
+
+# 이미지 파일 시그니처 → 저장 확장자
+IMAGE_SIGNATURES = (
+    (b'\xff\xd8\xff', '.jpg'),
+    (b'\x89PNG\r\n\x1a\n', '.png'),
+    (b'GIF87a', '.gif'),
+    (b'GIF89a', '.gif'),
+)
+
+# BMP는 'BM' 두 바이트만으로는 텍스트 응답과 구분되지 않으므로 DIB 헤더 크기(14~17바이트)도 확인
+BMP_DIB_HEADER_SIZES = (12, 40, 52, 56, 108, 124)
+
+# 형식 판별에 필요한 파일 앞부분 길이
+IMAGE_HEAD_BYTES = 32
+
+# 이미지로 받아들이는 Content-Type (헤더가 없으면 내용 검사로만 판단)
+ALLOWED_IMAGE_CONTENT_TYPES = ('image/', 'application/octet-stream', 'binary/octet-stream')
+
+
+def sniff_image_type(head):
+    """파일 앞부분으로 이미지 형식을 판별해 확장자 반환 (이미지가 아니면 None)"""
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return '.webp'
+    if head[4:12] in (b'ftypavif', b'ftypavis'):
+        return '.avif'
+    if head[:2] == b'BM' and int.from_bytes(head[14:18], 'little') in BMP_DIB_HEADER_SIZES:
+        return '.bmp'
+    for signature, ext in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return ext
+    return None
+
+
+def check_image_headers(headers, max_bytes):
+    """Content-Type과 Content-Length로 이미지가 아니거나 너무 큰 응답을 미리 거름"""
+    content_type = (headers.get('content-type') or '').lower()
+    if content_type and not content_type.startswith(ALLOWED_IMAGE_CONTENT_TYPES):
+        raise ValueError(f"이미지가 아닌 응답 ({content_type})")
+    length = headers.get('content-length')
+    if length and length.isdigit() and int(length) > max_bytes:
+        raise ValueError(f"이미지 크기 초과 ({int(length):,} bytes)")
+
+
+class ThumbnailCache:
+    """정규화 이미지 URL과 내용 해시로 주소를 매기는 디스크 썸네일 캐시
+
+    index.json에 URL별 {hash, size, fetched_at, accessed_at, validated_at}과 검증자
+    (etag, last_modified, content_length)를 기록하고, 이미지는
+    objects/<해시 앞 2자리>/<해시>.<형식>에 한 번만 저장한다. 저장은 임시 파일에 나누어 쓴 뒤
+    rename하며, 이미지 시그니처가 아니거나 max_image_bytes를 넘으면 버린다. evict()는 max_age_days보다
+    오래 쓰지 않은 항목을 지우고, 전체 용량이 max_bytes를 넘으면 가장 오래 전에 쓴 항목부터 지운다.
+    마지막 검증 후 freshness_ttl초가 지난 항목은 조건부 요청으로 다시 확인한다.
+    """
+
+    def __init__(self, root=os.path.join("thumbnails", "cache"), max_bytes=500 * 1024 * 1024,
+                 max_age_days=30, freshness_ttl=24 * 3600, max_image_bytes=5 * 1024 * 1024):
+        self.root = root
+        self.freshness_ttl = freshness_ttl
+        self.max_image_bytes = max_image_bytes
+        self.objects_dir = os.path.join(root, "objects")
+        self.index_path = os.path.join(root, "index.json")
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 24 * 3600
+        os.makedirs(self.objects_dir, exist_ok=True)
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+
+    def object_path(self, digest, ext='.jpg'):
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}{ext}")
+
+    def lookup(self, url):
+        """캐시 항목 조회 (이미지 파일이 없으면 None)"""
+        entry = self.index.get(canonical_image_url(url))
+        if entry and os.path.exists(self.path_of(entry)):
+            entry['accessed_at'] = time.time()
+            return entry
+        return None
+
+    def path_of(self, entry):
+        return self.object_path(entry['hash'], entry.get('ext', '.jpg'))
+
+    def is_fresh(self, entry):
+        return time.time() - entry.get('validated_at', entry['fetched_at']) < self.freshness_ttl
+
+    def conditional_headers(self, entry):
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def mark_validated(self, entry):
+        entry['validated_at'] = time.time()
+
+    def put(self, url, data, headers=None):
+        """메모리에 있는 이미지 내용과 응답 검증자를 저장하고 경로 반환 (같은 내용이 이미 있으면 재사용)"""
+        headers = headers or {}
+        check_image_headers(headers, self.max_image_bytes)
+        if len(data) > self.max_image_bytes:
+            raise ValueError(f"이미지 크기 초과 ({len(data):,} bytes)")
+        ext = sniff_image_type(data[:IMAGE_HEAD_BYTES])
+        if ext is None:
+            raise ValueError("이미지 형식이 아닌 내용")
+
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.object_path(digest, ext)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_atomic(path, data)
+        return self.record(url, digest, ext, len(data), headers)
+
+    async def put_stream(self, url, response, chunk_size=64 * 1024):
+        """응답 본문을 청크 단위로 임시 파일에 쓰면서 해시/크기/형식을 검사하고, 끝나면 rename으로 저장"""
+        check_image_headers(response.headers, self.max_image_bytes)
+
+        fd, temp_path = tempfile.mkstemp(dir=self.objects_dir, prefix='.tmp_')
+        try:
+            digest = hashlib.sha256()
+            size = 0
+            head = b''
+            ext = None
+            with os.fdopen(fd, 'wb') as f:
+                async for chunk in response.aiter_bytes(chunk_size):
+                    size += len(chunk)
+                    if size > self.max_image_bytes:
+                        raise ValueError(f"이미지 크기 초과 (>{self.max_image_bytes:,} bytes)")
+                    if ext is None:
+                        head += chunk[:IMAGE_HEAD_BYTES - len(head)]
+                        if len(head) >= IMAGE_HEAD_BYTES:
+                            ext = sniff_image_type(head)
+                            if ext is None:
+                                raise ValueError("이미지 형식이 아닌 내용")
+                    digest.update(chunk)
+                    f.write(chunk)
+
+            if ext is None:
+                ext = sniff_image_type(head)
+                if ext is None:
+                    raise ValueError("이미지 형식이 아닌 내용")
+
+            digest = digest.hexdigest()
+            path = self.object_path(digest, ext)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        return self.record(url, digest, ext, size, response.headers)
+
+    def record(self, url, digest, ext, size, headers):
+        now = time.time()
+        self.index[canonical_image_url(url)] = {
+            'hash': digest, 'ext': ext, 'size': size, 'fetched_at': now, 'accessed_at': now,
+            'validated_at': now,
+            'etag': headers.get('etag'),
+            'last_modified': headers.get('last-modified'),
+            'content_length': headers.get('content-length') or str(size),
+        }
+        return self.object_path(digest, ext)
+
+    def evict(self):
+        """기간 초과 항목과 용량 초과분(LRU)을 삭제하고, 참조가 없어진 이미지 파일 제거"""
+        now = time.time()
+        for key in [k for k, e in self.index.items() if now - e['accessed_at'] > self.max_age]:
+            del self.index[key]
+
+        # 같은 해시를 여러 URL이 공유하므로 해시별 마지막 사용 시각 기준으로 정리
+        last_access = {}
+        sizes = {}
+        for entry in self.index.values():
+            last_access[entry['hash']] = max(last_access.get(entry['hash'], 0), entry['accessed_at'])
+            sizes[entry['hash']] = entry['size']
+        total = sum(sizes.values())
+        dropped = set()
+        for digest in sorted(last_access, key=last_access.get):
+            if total <= self.max_bytes:
+                break
+            dropped.add(digest)
+            total -= sizes[digest]
+        if dropped:
+            self.index = {k: e for k, e in self.index.items() if e['hash'] not in dropped}
+
+        live = {entry['hash'] for entry in self.index.values()}
+        for directory, _, files in os.walk(self.objects_dir):
+            for name in files:
+                if name.startswith('.tmp_') or name.split('.')[0] not in live:
+                    try:
+                        os.remove(os.path.join(directory, name))
+                    except OSError:
+                        pass
+
+    def save(self):
+        write_atomic(self.index_path, json.dumps(self.index).encode('utf-8'))
+
+
+class BrowserImageCapture:
+    """스크롤 중 브라우저가 받은 이미지 응답을 기억해 두었다가 썸네일 캐시에 바로 저장"""
+
+    def __init__(self, page, max_responses=5000):
+        self.responses = {}
+        self.max_responses = max_responses
+        page.on("response", self.on_response)
+
+    def on_response(self, response):
+        if (response.request.resource_type == 'image' and response.status == 200
+                and len(self.responses) < self.max_responses):
+            self.responses[canonical_image_url(response.url)] = response
+
+    async def store(self, products, cache):
+        """상품 썸네일 중 브라우저가 이미 받은 이미지를 캐시에 저장하고 저장 개수 반환"""
+        stored = 0
+        for product in products:
+            thumbnail = product.get('thumbnail')
+            if not thumbnail or thumbnail == "N/A" or thumbnail.startswith('data:'):
+                continue
+            response = self.responses.get(canonical_image_url(thumbnail))
+            if response is None:
+                continue
+            entry = cache.lookup(thumbnail)
+            if entry and cache.is_fresh(entry):
+                # 이미 유효한 캐시가 있으면 저장 없이 그 파일을 사용 (다운로드 작업자가 다시 받지 않게)
+                product['thumbnail_local'] = cache.path_of(entry)
+                continue
+            try:
+                body = await response.body()
+                product['thumbnail_local'] = cache.put(thumbnail, body, response.headers)
+            except Exception:
+                continue
+            stored += 1
+        return stored
+
+
+class FetchError(Exception):
+    pass
+
+
+class CircuitOpenError(FetchError):
+    pass
+
+
+class RetryableStatusError(FetchError):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class CircuitBreaker:
+    """호스트별 서킷 브레이커
+
+    최근 window건 중 min_requests건 이상에서 오류율이 threshold를 넘으면 cooldown초 동안
+    그 호스트로의 요청을 막고, 이후 한 건을 시험 삼아 보내 성공하면 다시 연다.
+    """
+
+    def __init__(self, window=20, min_requests=10, threshold=0.5, cooldown=30):
+        self.window = window
+        self.min_requests = min_requests
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.outcomes = {}
+        self.opened_at = {}
+        self.trial_running = set()
+        self.trips = Counter()
+
+    def allow(self, host):
+        opened_at = self.opened_at.get(host)
+        if opened_at is None:
+            return True
+        if time.monotonic() - opened_at < self.cooldown or host in self.trial_running:
+            return False
+        self.trial_running.add(host)
+        return True
+
+    def release_trial(self, host):
+        """취소된 시험 요청의 자리를 비움"""
+        self.trial_running.discard(host)
+
+    def record(self, host, ok):
+        outcomes = self.outcomes.setdefault(host, [])
+        outcomes.append(ok)
+        del outcomes[:-self.window]
+
+        if host in self.trial_running:
+            self.trial_running.discard(host)
+            if ok:
+                self.opened_at.pop(host, None)
+                outcomes.clear()
+            else:
+                self.opened_at[host] = time.monotonic()
+            return
+
+        failures = outcomes.count(False)
+        if (host not in self.opened_at and len(outcomes) >= self.min_requests
+                and failures / len(outcomes) > self.threshold):
+            self.opened_at[host] = time.monotonic()
+            self.trips[host] += 1
+
+
+class LatencyRecorder:
+    """이미지 요청 지연 기록
+
+    백분위는 FetchPolicy.run 한 번(재시도, 백오프, 헤징 포함)의 전체 소요 시간으로 계산한다.
+    시도별 소요 시간은 헤징 기준용으로 최근 recent_window건만 보관하고, 전체 기록을 정렬하는 것은 summary뿐이다.
+    """
+
+    def __init__(self, recent_window=200):
+        self.samples = []
+        self.recent = deque(maxlen=recent_window)
+        self.outcomes = Counter()
+        self.attempts = Counter()
+
+    def record(self, seconds, outcome):
+        """요청 하나의 전체 소요 시간과 최종 결과"""
+        self.outcomes[outcome] += 1
+        self.samples.append(seconds)
+
+    def record_attempt(self, seconds, outcome):
+        """시도 하나의 소요 시간과 결과 (성공한 시도만 헤징 기준에 반영)"""
+        self.attempts[outcome] += 1
+        if outcome == 'ok':
+            self.recent.append(seconds)
+
+    @staticmethod
+    def percentile_of(ordered, p):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+    def recent_percentile(self, p):
+        """최근 recent_window건의 백분위 (기록이 없으면 None)"""
+        if not self.recent:
+            return None
+        return self.percentile_of(sorted(self.recent), p)
+
+    def summary(self):
+        if not self.samples:
+            return "이미지 요청 지연: 기록 없음"
+        ordered = sorted(self.samples)
+        p50, p95, p99 = (self.percentile_of(ordered, p) * 1000 for p in (50, 95, 99))
+        outcomes = ", ".join(f"{k} {v}" for k, v in self.outcomes.most_common())
+        attempts = ", ".join(f"{k} {v}" for k, v in self.attempts.most_common())
+        return (f"이미지 요청 지연(재시도·헤징 포함): p50 {p50:.0f}ms, p95 {p95:.0f}ms, p99 {p99:.0f}ms "
+                f"(요청 {outcomes} / 시도 {attempts})")
+
+
+class FetchPolicy:
+    """이미지 요청 정책: 시도별 시간 제한, 지터 백오프 재시도, 느린 요청 헤징, 호스트별 서킷 브레이커
+
+    느린 시도는 최근 시도들의 p95 지연(최소 hedge_min초)이 지나면 같은 요청을 하나 더 보내 먼저 끝난 쪽을 쓴다.
+    """
+
+    def __init__(self, retries=2, backoff_base=0.3, backoff_max=3.0, attempt_timeout=8.0,
+                 hedge_initial=1.5, hedge_min=0.5, breaker=None, recorder=None):
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.attempt_timeout = attempt_timeout
+        self.hedge_initial = hedge_initial
+        self.hedge_min = hedge_min
+        self.breaker = breaker or CircuitBreaker()
+        self.recorder = recorder or LatencyRecorder()
+        self.stats = Counter()
+
+    def hedge_delay(self):
+        if len(self.recorder.recent) < 20:
+            return self.hedge_initial
+        return max(self.hedge_min, self.recorder.recent_percentile(95))
+
+    async def run(self, url, attempt, slot=None, retries=None, breaker_key=None):
+        """attempt()를 정책에 따라 실행 (RetryableStatusError/네트워크 오류/시간 초과만 재시도)
+
+        slot()은 동시 요청 제한을 얻는 비동기 컨텍스트를 돌려준다. 자리를 기다리는 시간은 지연,
+        시간 제한, 헤징, 서킷 브레이커 어디에도 반영하지 않고 자리를 얻은 뒤부터 시간을 잰다.
+        retries는 이 요청만의 재시도 횟수, breaker_key는 호스트 대신 쓸 서킷 브레이커 키다.
+        """
+        host = breaker_key or urlparse(url).hostname or ''
+        slot = slot or nullcontext
+        retries = self.retries if retries is None else retries
+        # 첫 시도가 자리를 기다린 시간 (전체 소요 시간에서 뺌)
+        queued = []
+        start = time.perf_counter()
+        outcome = 'error'
+        try:
+            for try_number in range(retries + 1):
+                if not self.breaker.allow(host):
+                    self.stats['circuit_open'] += 1
+                    outcome = 'circuit_open'
+                    raise CircuitOpenError(f"{host} 요청 차단 중 (오류율 초과)")
+                try:
+                    result = await self.hedged(host, attempt, slot, queued)
+                    outcome = 'ok'
+                    return result
+                except asyncio.TimeoutError:
+                    outcome = 'timeout'
+                    if try_number == retries:
+                        raise
+                except (RetryableStatusError, httpx.TransportError):
+                    outcome = 'error'
+                    if try_number == retries:
+                        raise
+                except Exception:
+                    outcome = 'rejected'
+                    raise
+                self.stats['retry'] += 1
+                delay = min(self.backoff_max, self.backoff_base * 2 ** try_number)
+                await asyncio.sleep(random.uniform(0, delay))
+        except asyncio.CancelledError:
+            outcome = 'cancelled'
+            raise
+        finally:
+            # 한 번도 자리를 얻지 못했거나 중지로 취소된 요청은 지연 통계에서 제외
+            if queued and outcome != 'cancelled':
+                self.recorder.record(time.perf_counter() - start - sum(queued), outcome)
+
+    async def timed(self, host, attempt):
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(attempt(), self.attempt_timeout)
+        except asyncio.CancelledError:
+            self.recorder.record_attempt(time.perf_counter() - start, 'cancelled')
+            self.breaker.release_trial(host)
+            raise
+        except asyncio.TimeoutError:
+            self.recorder.record_attempt(time.perf_counter() - start, 'timeout')
+            self.breaker.record(host, False)
+            raise
+        except (RetryableStatusError, httpx.TransportError):
+            self.recorder.record_attempt(time.perf_counter() - start, 'error')
+            self.breaker.record(host, False)
+            raise
+        except Exception:
+            # 이미지가 아닌 응답처럼 호스트는 정상 응답한 경우
+            self.recorder.record_attempt(time.perf_counter() - start, 'rejected')
+            self.breaker.record(host, True)
+            raise
+        self.recorder.record_attempt(time.perf_counter() - start, 'ok')
+        self.breaker.record(host, True)
+        return result
+
+    async def slotted(self, host, attempt, slot):
+        """자리를 얻은 뒤 한 번 시도 (헤징 요청용)"""
+        try:
+            async with slot():
+                return await self.timed(host, attempt)
+        except asyncio.CancelledError:
+            # 자리를 기다리다 취소돼도 시험 요청 자리는 비움
+            self.breaker.release_trial(host)
+            raise
+
+    async def hedged(self, host, attempt, slot, queued):
+        # 헤징 대기 시간도 첫 시도가 자리를 얻은 뒤부터 잰다
+        wait_start = time.perf_counter()
+        try:
+            async with slot():
+                queued.append(time.perf_counter() - wait_start)
+                return await self.hedged_in_slot(host, attempt, slot)
+        except asyncio.CancelledError:
+            self.breaker.release_trial(host)
+            raise
+
+    async def hedged_in_slot(self, host, attempt, slot):
+        tasks = [asyncio.ensure_future(self.timed(host, attempt))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay())
+            if not done and self.breaker.allow(host):
+                self.stats['hedged'] += 1
+                tasks.append(asyncio.ensure_future(self.slotted(host, attempt, slot)))
+
+            pending = set(tasks)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not tasks[0]:
+                            self.stats['hedge_won'] += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+
+class ImageDownloader:
+    """keep-alive 연결 풀(HTTP/2 지원 시 다중화)을 공유하는 비동기 썸네일 다운로더
+
+    전체 동시 요청 수는 concurrency, 호스트별 동시 요청 수는 per_host로 제한한다 (slot으로 자리를 얻은 뒤 요청).
+    """
+
+    def __init__(self, concurrency=16, per_host=8, timeout=10):
+        self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=concurrency,
+                                max_keepalive_connections=concurrency),
+            timeout=timeout,
+            headers={'User-Agent': USER_AGENT},
+            follow_redirects=True,
+        )
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.per_host = per_host
+        self.host_semaphores = {}
+
+    def host_semaphore(self, url):
+        host = urlparse(url).hostname or ''
+        if host not in self.host_semaphores:
+            self.host_semaphores[host] = asyncio.Semaphore(self.per_host)
+        return self.host_semaphores[host]
+
+    @asynccontextmanager
+    async def slot(self, url):
+        """전체/호스트별 동시 요청 자리 하나 (stream/head는 이 안에서 호출)"""
+        async with self.semaphore, self.host_semaphore(url):
+            yield
+
+    @asynccontextmanager
+    async def stream(self, url, headers=None):
+        """본문을 읽지 않은 응답을 돌려줌 (컨텍스트 안에서 aiter_bytes로 나누어 읽음)"""
+        async with self.client.stream('GET', url, headers=headers) as response:
+            yield response
+
+    async def head(self, url):
+        return await self.client.head(url)
+
+    async def close(self):
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+def category_of(url):
+    """카테고리 URL에서 dispCtgr3No(없으면 dispCtgr2No) 추출"""
+    query = parse_qs(urlparse(url).query)
+    for key in ('dispCtgr3No', 'dispCtgr2No'):
+        if query.get(key):
+            return query[key][0]
+    return url
+
+
+def build_product(record):
+    """카드 레코드(url, data_log, name, price, img 속성)를 상품 dict로 변환"""
+    product = {}
+
+    product['url'] = record.get('url')
+    product['name'] = record.get('name') if record.get('name') is not None else "N/A"
+
+    data_log = record.get('data_log')
+    if record.get('price') is not None:
+        product['price'] = record['price']
+    elif data_log and 'last_discount_price' in data_log:
+        try:
+            log_data = json.loads(data_log.replace('&quot;', '"'))
+            product['price'] = log_data.get('last_discount_price', 'N/A')
+        except:
+            product['price'] = "N/A"
+    else:
+        product['price'] = "N/A"
+
+    if record.get('has_img'):
+        product['thumbnail'] = (record.get('src') or record.get('data_src')
+                                or record.get('data_original'))
+    else:
+        product['thumbnail'] = "N/A"
+
+    product['registered_date'] = datetime.now().strftime("%Y-%m-%d")
+
+    return product
+
+
+class BrowserPool:
+    """미리 띄워 둔 브라우저와 컨텍스트 풀 (BrowserService 이벤트 루프 안에서만 사용)"""
+
+    def __init__(self, playwright, browser_count=1, contexts_per_browser=2,
+                 max_pages_per_context=20, headless=False, context_options=None):
+        self.playwright = playwright
+        self.browser_count = browser_count
+        self.contexts_per_browser = contexts_per_browser
+        self.max_pages_per_context = max_pages_per_context
+        self.headless = headless
+        self.context_options = context_options or {}
+        self.browsers = []
+        # 임대 가능한 자리 (None은 컨텍스트 생성에 실패해 비어 있는 자리, 다음 임대 때 다시 생성)
+        self.idle = asyncio.Queue()
+        self.size = 0
+        self.capacity_lock = asyncio.Lock()
+        self.page_counts = {}
+        self.owners = {}
+
+    async def start(self):
+        """브라우저를 실행하고 컨텍스트를 미리 생성"""
+        for _ in range(self.browser_count):
+            browser = await self.playwright.chromium.launch(headless=self.headless)
+            self.browsers.append(browser)
+            for _ in range(self.contexts_per_browser):
+                self.idle.put_nowait(await self._new_context(browser))
+                self.size += 1
+
+    async def ensure_capacity(self, count):
+        """자리(컨텍스트) 총 개수가 count 이상이 되도록 브라우저에 나누어 추가 생성"""
+        # 여러 카테고리가 동시에 호출해도 한 번만 늘림
+        async with self.capacity_lock:
+            while self.size < count:
+                browser = await self._connected_browser(self.size)
+                self.idle.put_nowait(await self._new_context(browser))
+                self.size += 1
+
+    async def _connected_browser(self, index=0):
+        """연결된 브라우저 하나를 반환 (모두 끊겼을 때만 새로 실행)"""
+        self.browsers = [browser for browser in self.browsers if browser.is_connected()]
+        if not self.browsers:
+            self.browsers.append(await self.playwright.chromium.launch(headless=self.headless))
+        return self.browsers[index % len(self.browsers)]
+
+    async def _new_context(self, browser):
+        context = await browser.new_context(**self.context_options)
+        self.page_counts[context] = 0
+        self.owners[context] = browser
+        return context
+
+    async def _replace_context(self, context):
+        """사용 한도에 도달했거나 손상된 컨텍스트를 닫고 새로 생성 (context가 None이면 빈 자리에 생성)"""
+        browser = None
+        if context is not None:
+            browser = self.owners.pop(context, None)
+            self.page_counts.pop(context, None)
+            try:
+                await context.close()
+            except Exception:
+                pass
+
+        if browser is None or not browser.is_connected():
+            browser = await self._connected_browser()
+
+        return await self._new_context(browser)
+
+    @asynccontextmanager
+    async def lease(self):
+        """유휴 컨텍스트를 빌려주고, 사용 후 열린 페이지를 닫아 풀에 반환
+
+        컨텍스트를 새로 만들지 못해도 자리는 항상 큐에 돌려놓아 다음 임대가 영원히 기다리지 않게 한다.
+        """
+        context = await self.idle.get()
+        try:
+            if context is None or not self.owners[context].is_connected():
+                context = await self._replace_context(context)
+        except BaseException:
+            self.idle.put_nowait(None)
+            raise
+
+        try:
+            yield context
+        finally:
+            await self._release(context)
+
+    async def _release(self, context):
+        try:
+            pages = list(context.pages)
+            for page in pages:
+                await page.close()
+            self.page_counts[context] += len(pages)
+            recycle = self.page_counts[context] >= self.max_pages_per_context
+        except Exception:
+            recycle = True
+
+        if recycle:
+            try:
+                context = await self._replace_context(context)
+            except Exception:
+                # 새 컨텍스트 생성 실패는 빈 자리로 돌려놓고 다음 임대에서 다시 시도
+                context = None
+        self.idle.put_nowait(context)
+
+    async def close(self):
+        for browser in self.browsers:
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        self.browsers = []
+        self.page_counts.clear()
+        self.owners.clear()
+
+
+class BrowserService:
+    """Playwright와 브라우저 풀을 소유하는 상주 이벤트 루프 스레드
+
+    크롤링 코루틴은 run()으로 이 루프에서 실행되며, lease()로 컨텍스트를 빌려 쓴다.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, browser_count=1, contexts_per_browser=2, max_pages_per_context=20,
+                 headless=False):
+        self.browser_count = browser_count
+        self.contexts_per_browser = contexts_per_browser
+        self.max_pages_per_context = max_pages_per_context
+        self.headless = headless
+        self.playwright_manager = None
+        self.playwright = None
+        self.pool = None
+        self.start_lock = None
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run_loop, name="BrowserService", daemon=True)
+        self.thread.start()
+
+    @classmethod
+    def instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def shutdown_instance(cls):
+        with cls._instance_lock:
+            if cls._instance is not None:
+                cls._instance.shutdown()
+                cls._instance = None
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.start_lock = asyncio.Lock()
+        self.loop.run_forever()
+
+    def run(self, coro):
+        """코루틴을 서비스 루프에서 실행하고 끝날 때까지 대기 (호출 스레드를 블록)"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def warm_up(self):
+        """백그라운드에서 Playwright와 브라우저 풀을 미리 시작"""
+        future = asyncio.run_coroutine_threadsafe(self.ensure_started(), self.loop)
+        future.add_done_callback(lambda f: f.exception())
+
+    async def ensure_started(self):
+        async with self.start_lock:
+            if self.pool is not None:
+                return self.pool
+
+            self.playwright_manager = async_playwright()
+            self.playwright = await self.playwright_manager.start()
+            pool = BrowserPool(
+                self.playwright,
+                browser_count=self.browser_count,
+                contexts_per_browser=self.contexts_per_browser,
+                max_pages_per_context=self.max_pages_per_context,
+                headless=self.headless,
+                context_options={
+                    'viewport': {'width': 1920, 'height': 1080},
+                    'user_agent': USER_AGENT
+                },
+            )
+            try:
+                await pool.start()
+            except Exception:
+                await pool.close()
+                await self._stop_playwright()
+                raise
+            self.pool = pool
+            return pool
+
+    async def ensure_capacity(self, count):
+        """동시에 임대 가능한 컨텍스트를 count개 이상 확보"""
+        pool = await self.ensure_started()
+        await pool.ensure_capacity(count)
+
+    @asynccontextmanager
+    async def lease(self):
+        """컨텍스트 임대 (서비스 루프 안에서 호출)"""
+        pool = await self.ensure_started()
+        async with pool.lease() as context:
+            yield context
+
+    async def _stop_playwright(self):
+        if self.playwright_manager is not None:
+            try:
+                await self.playwright_manager.__aexit__(None, None, None)
+            except Exception:
+                pass
+        self.playwright_manager = None
+        self.playwright = None
+
+    async def _close(self):
+        # 시작 중이면 끝난 뒤에 정리
+        async with self.start_lock:
+            if self.pool is not None:
+                await self.pool.close()
+                self.pool = None
+            await self._stop_playwright()
+
+    def shutdown(self):
+        """브라우저를 모두 닫고 이벤트 루프 스레드 종료"""
+        try:
+            self.run(self._close())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout=10)
 
 
 class CrawlerThread(QThread):
     progress = pyqtSignal(str)
     result = pyqtSignal(list)
+    batch = pyqtSignal(list)
+    image_ready = pyqtSignal(int, str)
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
-    def __init__(self, url):
+    def __init__(self, urls, concurrency=1, bulk_extract=True, block_profile='default',
+                 extraction_mode='dom', http_fast_path=True, stream_results=True, batch_size=50,
+                 download_workers=16, download_per_host=8, reuse_browser_images=True,
+                 request_cdn_variants=True):
         super().__init__()
-        self.url = url
+        self.urls = [urls] if isinstance(urls, str) else list(urls)
+        self.concurrency = max(1, concurrency)
+        self.bulk_extract = bulk_extract
+        self.extraction_mode = extraction_mode
+        self.http_fast_path = http_fast_path
+        self.stream_results = stream_results
+        self.batch_size = batch_size
+        self.download_workers = max(1, download_workers)
+        self.download_per_host = max(1, download_per_host)
+        self.reuse_browser_images = reuse_browser_images
+        self.request_cdn_variants = request_cdn_variants
+        self.downloader = None
+        self.thumbnail_cache = None
+        self.image_stats = Counter()
+        self.fetch_policy = None
+        self.download_queue = None
+        self.downloaded = 0
+        self.block_profile = block_profile
+        self.network_stats = NetworkStats()
         self.products = []
         self.is_running = True
 
@@ -34,7 +1488,7 @@ class CrawlerThread(QThread):
 
     def run(self):
         try:
-            asyncio.run(self.crawl())
+            BrowserService.instance().run(self.crawl())
         except Exception as e:
             if self.is_running:
                 self.error.emit(f"크롤링 오류: {str(e)}")
@@ -45,189 +1499,1134 @@ class CrawlerThread(QThread):
         if not self.is_running:
             return
 
-        self.progress.emit("브라우저 초기화 중...")
+        self.network_stats = NetworkStats()
+        self.products = []
 
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=False)
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            )
-            page = await context.new_page()
+        semaphore = asyncio.Semaphore(self.concurrency)
 
-            try:
-                if not self.is_running:
-                    await browser.close()
-                    return
+        async def crawl_bounded(url):
+            async with semaphore:
+                return await self.crawl_category(url)
 
-                self.progress.emit(f"페이지 로딩 중: {self.url}")
-                await page.goto(self.url, timeout=60000)
+        # 추출된 상품은 바로 큐에 넣고, 다운로드 작업자들이 추출과 동시에 이미지를 받음
+        self.download_queue = asyncio.Queue()
+        self.downloaded = 0
+        self.downloader = ImageDownloader(concurrency=self.download_workers,
+                                          per_host=self.download_per_host)
+        self.thumbnail_cache = ThumbnailCache()
+        self.image_stats = Counter()
+        self.fetch_policy = FetchPolicy()
+        workers = [asyncio.create_task(self.download_worker()) for _ in range(self.download_workers)]
 
-                if not self.is_running:
-                    await browser.close()
-                    return
+        try:
+            # 한 카테고리의 예상치 못한 오류가 나머지 카테고리를 버리지 않도록 결과로 받음
+            results = await asyncio.gather(*(crawl_bounded(url) for url in self.urls),
+                                           return_exceptions=True)
+            for url, result in zip(self.urls, results):
+                if isinstance(result, BaseException):
+                    self.progress.emit(f"[{category_of(url)}] 카테고리 처리 오류: {str(result)}")
+            results = [None if isinstance(result, BaseException) else result for result in results]
+
+            if self.is_running and len(self.urls) > 1:
+                self.progress.emit(f"총 {len(self.products)}개 상품 발견 ({len(self.urls)}개 카테고리)")
+            self.progress.emit(self.network_stats.summary())
+            if self.download_queue.qsize():
+                self.progress.emit(f"남은 이미지 다운로드 중... ({self.download_queue.qsize()}개 대기)")
+
+            for _ in workers:
+                self.download_queue.put_nowait(None)
+            await asyncio.gather(*workers)
+            self.progress.emit(
+                f"썸네일: 브라우저 재사용 {self.image_stats['browser_reused']}개, "
+                f"캐시 유효 {self.image_stats['fresh']}개, "
+                f"304 재검증 {self.image_stats['not_modified']}개, "
+                f"크기 일치 {self.image_stats['length_match']}개, "
+                f"전체 다운로드 {self.image_stats['full_fetch']}개, "
+                f"재검증 실패로 기존 사용 {self.image_stats['stale']}개, "
+                f"CDN 축소 이미지 {self.image_stats['variant']}개 (실패 후 원본 {self.image_stats['variant_failed']}개), "
+                f"받은 용량 {self.image_stats['bytes'] / 1024:,.0f} KB "
+                f"(이미지당 {self.image_stats['bytes'] / max(1, self.image_stats['full_fetch']) / 1024:,.1f} KB)")
+            policy = self.fetch_policy
+            self.progress.emit(
+                f"{policy.recorder.summary()}, 재시도 {policy.stats['retry']}회, "
+                f"헤지 {policy.stats['hedged']}회 (헤지 승 {policy.stats['hedge_won']}회), "
+                f"서킷 차단 {policy.stats['circuit_open']}회")
+            for host, trips in policy.breaker.trips.items():
+                self.progress.emit(f"⚠ {host}: 오류율 초과로 {trips}회 차단됨")
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await self.downloader.close()
+            self.thumbnail_cache.evict()
+            self.thumbnail_cache.save()
+
+        # 모든 카테고리가 실패하면 결과를 내보내지 않음
+        if not self.is_running or all(result is None for result in results):
+            return
 
-                # 상품 리스트가 로드될 때까지 대기
-                self.progress.emit("상품 목록 로딩 대기 중...")
-                await page.wait_for_selector("//a[contains(@class, 'c-card-item__anchor')]", timeout=30000)
-                await asyncio.sleep(2)
+        # 결과는 상품이 추출된 순서(행 번호 순)
+        self.result.emit(self.products)
+
+    def publish(self, products):
+        """추출된 상품에 행 번호를 붙여 다운로드 큐에 넣고, 스트리밍 모드면 batch_size 단위로 GUI에 전달"""
+        for start in range(0, len(products), self.batch_size):
+            chunk = products[start:start + self.batch_size]
+            for product in chunk:
+                product['index'] = len(self.products)
+                self.products.append(product)
+                self.download_queue.put_nowait(product)
+            if self.stream_results:
+                self.batch.emit(chunk)
+
+    async def crawl_category(self, url):
+        """카테고리 하나를 크롤링하고 카테고리 태그가 붙은 상품 목록 반환 (오류 시 None)"""
+        category = category_of(url)
+        prefix = f"[{category}] " if len(self.urls) > 1 else ""
 
-                if not self.is_running:
-                    await browser.close()
-                    return
+        if not self.is_running:
+            return []
 
-                # Lazy Loading을 위한 점진적 스크롤
-                self.progress.emit("페이지 스크롤 중 (이미지 로딩)...")
-                await self.scroll_gradually(page)
+        if self.http_fast_path:
+            products = await self.crawl_category_over_http(url, prefix)
+            if products:
+                return self.tag_products(products, category, url)
 
-                if not self.is_running:
-                    await browser.close()
-                    return
+        try:
+            return await self.crawl_category_in_browser(url, category, prefix)
+        except Exception as e:
+            # 브라우저 임대/페이지 생성 실패도 이 카테고리만 건너뜀
+            if self.is_running:
+                if len(self.urls) > 1:
+                    self.progress.emit(f"{prefix}페이지 처리 오류: {str(e)}")
+                else:
+                    self.error.emit(f"페이지 처리 오류: {str(e)}")
+            return None
+
+    async def crawl_category_in_browser(self, url, category, prefix):
+        """브라우저로 카테고리 하나를 크롤링 (오류는 호출한 crawl_category가 처리)
+
+        브라우저 풀은 HTTP 경로로 끝나지 않은 카테고리가 처음 생길 때 시작하고 동시 실행 수만큼 늘린다.
+        """
+        service = BrowserService.instance()
+        if service.pool is None:
+            self.progress.emit(f"{prefix}브라우저 준비 중...")
+        await service.ensure_capacity(self.concurrency)
+        async with service.lease() as context:
+            page = await context.new_page()
+            await install_resource_blocking(page, self.block_profile, self.network_stats)
+            capture = ListingCapture(page) if self.extraction_mode == 'json' else None
+            image_capture = BrowserImageCapture(page) if self.reuse_browser_images else None
 
-                # 상품 수집
-                self.progress.emit("상품 정보 수집 중...")
-                products = await self.extract_products(page)
+            self.progress.emit(f"{prefix}페이지 로딩 중: {url}")
+            load_start = time.perf_counter()
+            await page.goto(url, timeout=60000)
 
-                if not self.is_running:
-                    await browser.close()
-                    return
+            if not self.is_running:
+                return []
 
-                self.progress.emit(f"총 {len(products)}개 상품 발견")
+            # 상품 리스트가 로드될 때까지 대기
+            self.progress.emit(f"{prefix}상품 목록 로딩 대기 중...")
+            await page.wait_for_selector(CARD_ANCHOR_XPATH, timeout=30000)
+            self.network_stats.load_times.append(time.perf_counter() - load_start)
+            await asyncio.sleep(2)
 
-                # 이미지 다운로드
-                if products and self.is_running:
-                    await self.download_images(products)
+            if not self.is_running:
+                return []
 
-                if self.is_running:
-                    self.products = products
-                    self.result.emit(products)
+            # Lazy Loading을 위한 점진적 스크롤 (JSON 모드는 다음 페이지 요청만 유도하고 이미지는 기다리지 않음)
+            self.progress.emit(f"{prefix}페이지 스크롤 중 (이미지 로딩)...")
+            scroll_start = time.perf_counter()
+            card_count = await self.scroll_until_stable(page, wait_images=capture is None, prefix=prefix)
+            self.network_stats.scroll_times.append(time.perf_counter() - scroll_start)
 
-            except Exception as e:
-                if self.is_running:
-                    self.error.emit(f"페이지 처리 오류: {str(e)}")
-            finally:
-                await browser.close()
+            if not self.is_running:
+                return []
+
+            # 상품 수집 (첫 묶음은 HTML, 이후는 XHR처럼 API 응답이 일부뿐이면 화면에서 수집)
+            products = await capture.drain() if capture else []
+            if products:
+                self.progress.emit(
+                    f"{prefix}목록 API 응답 {capture.responses}건에서 상품 {len(products)}개 수집")
+            if len(products) < card_count or not products:
+                if capture and not products:
+                    self.progress.emit(f"{prefix}목록 API 응답 없음, 화면에서 수집합니다")
+                elif capture:
+                    self.progress.emit(
+                        f"{prefix}목록 API 상품 {len(products)}개가 화면 상품 {card_count}개보다 적어 화면에서 수집합니다")
+                self.progress.emit(f"{prefix}상품 정보 수집 중...")
+                dom_products = await self.extract_products(page, prefix)
+                if len(dom_products) >= len(products):
+                    products = dom_products
+
+            # 페이지를 닫기 전에 브라우저가 이미 받은 썸네일을 캐시에 저장해 재다운로드를 생략
+            if image_capture and products:
+                reused = await image_capture.store(products, self.thumbnail_cache)
+                self.image_stats['browser_reused'] += reused
+                if reused:
+                    self.progress.emit(f"{prefix}브라우저가 받은 썸네일 {reused}개 재사용")
+
+            self.progress.emit(f"{prefix}총 {len(products)}개 상품 발견")
+            return self.tag_products(products, category, url)
+
+    async def crawl_category_over_http(self, url, prefix=""):
+        """HTTP 요청과 HTML 파싱만으로 카테고리 수집 (결과가 불완전하면 None 반환해 브라우저 경로로 전환)"""
+        self.progress.emit(f"{prefix}HTTP로 페이지 요청 중: {url}")
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            products, truncation = await loop.run_in_executor(None, fetch_products_over_http, url)
+        except Exception as e:
+            self.progress.emit(f"{prefix}HTTP 요청 실패, 브라우저로 전환: {str(e)}")
+            return None
+
+        if not is_complete_listing(products):
+            self.progress.emit(f"{prefix}HTML 상품 정보 불완전 ({len(products)}개), 브라우저로 전환")
+            return None
+
+        # 무한 스크롤 카테고리는 HTML에 첫 묶음만 있으므로 스크롤할 수 있는 브라우저 경로로 전환
+        if truncation:
+            self.progress.emit(f"{prefix}HTML 목록이 일부만 포함됨 ({truncation}), 브라우저로 전환")
+            return None
+
+        self.progress.emit(
+            f"{prefix}HTTP로 상품 {len(products)}개 수집 ({time.perf_counter() - start:.1f}s, 브라우저 생략)")
+        return products
+
+    def tag_products(self, products, category, url):
+        for product in products:
+            product['category'] = category
+            product['category_url'] = url
+        self.publish(products)
+        return products
+
+    async def scroll_until_stable(self, page, wait_images=True, idle_ms=700, settle_rounds=3,
+                                  max_seconds=180, stall_ms=5000, prefix=""):
+        """페이지 내 관찰자 기반 스크롤: 카드 수와 로딩 중 이미지가 변하지 않으면 종료하고 마지막 카드 수 반환
+        (맨 위로 되돌아가지 않음, stall_ms 넘게 멈춘 카드 이미지는 기다리지 않음)"""
+        await page.evaluate(SCROLL_OBSERVER_JS, CARD_ANCHOR_CSS)
 
-    async def scroll_gradually(self, page):
-        """점진적 스크롤로 Lazy Loading 이미지 로드 (최대 100회 제한)"""
-        last_height = await page.evaluate("document.body.scrollHeight")
-        scroll_pause = 0.5
-        scroll_step = 800
-        max_scrolls = 100
+        deadline = time.perf_counter() + max_seconds
+        last_cards = -1
+        stable_rounds = 0
         scroll_count = 0
+        stalled = 0
 
-        current_position = 0
-        while scroll_count < max_scrolls and self.is_running:
-            current_position += scroll_step
-            await page.evaluate(f"window.scrollTo(0, {current_position})")
-            await asyncio.sleep(scroll_pause)
+        while self.is_running and time.perf_counter() < deadline:
+            status = await page.evaluate(SCROLL_STEP_JS, {'idleMs': idle_ms, 'stallMs': stall_ms})
             scroll_count += 1
+            stalled += status['stalled']
+
+            settled = status['atBottom'] and (status['pending'] == 0 or not wait_images)
+            if settled and status['cards'] == last_cards:
+                stable_rounds += 1
+            else:
+                stable_rounds = 0
+            last_cards = status['cards']
+
+            self.progress.emit(
+                f"{prefix}스크롤 중... ({status['position']}/{status['height']}px) "
+                f"상품 {status['cards']}개, 로딩 중 이미지 {status['pending']}개, "
+                f"응답 없는 이미지 {stalled}개 [{scroll_count}회]")
+
+            if stable_rounds >= settle_rounds:
+                break
+
+        return max(last_cards, 0)
 
-            new_height = await page.evaluate("document.body.scrollHeight")
+    async def extract_products(self, page, prefix=""):
+        """상품 정보 추출 (page.evaluate 한 번으로 일괄 추출, 실패 시 요소별 추출로 대체)"""
+        if not self.is_running:
+            return []
 
-            self.progress.emit(f"스크롤 중... ({current_position}/{new_height}px) [{scroll_count}/{max_scrolls}회]")
+        if self.bulk_extract:
+            try:
+                records = await page.evaluate(EXTRACT_CARDS_JS, CARD_ANCHOR_XPATH)
+                products = [build_product(record) for record in records]
+                self.progress.emit(f"{prefix}상품 {len(products)}개 일괄 추출 완료")
+                return products
+            except Exception as e:
+                self.progress.emit(f"{prefix}일괄 추출 실패, 요소별 추출로 전환: {str(e)}")
 
-            if current_position >= new_height:
-                if new_height == last_height:
-                    break
-                last_height = new_height
-                current_position = 0
+        return await self.extract_products_per_element(page, prefix)
 
-    async def extract_products(self, page):
-        """XPath를 사용한 상품 정보 추출"""
+    async def extract_products_per_element(self, page, prefix=""):
+        """XPath를 사용한 요소별 상품 정보 추출 (대체 경로)"""
         products = []
 
         if not self.is_running:
             return products
 
-        product_links = await page.query_selector_all("//a[contains(@class, 'c-card-item__anchor')]")
+        product_links = await page.query_selector_all(CARD_ANCHOR_XPATH)
 
-        self.progress.emit(f"상품 {len(product_links)}개 발견")
+        self.progress.emit(f"{prefix}상품 {len(product_links)}개 발견")
 
         for idx, link in enumerate(product_links, 1):
             if not self.is_running:
                 break
 
             try:
-                product = {}
+                record = {}
 
-                product['url'] = await link.get_attribute('href')
-                data_log = await link.get_attribute('data-log-body')
+                record['url'] = await link.get_attribute('href')
+                record['data_log'] = await link.get_attribute('data-log-body')
 
                 name_elem = await link.query_selector("xpath=.//span[@class='sr-only']")
-                if name_elem:
-                    product['name'] = await name_elem.inner_text()
-                else:
-                    product['name'] = "N/A"
+                record['name'] = await name_elem.inner_text() if name_elem else None
 
                 parent = await link.evaluate_handle("el => el.parentElement")
 
                 price_elem = await parent.query_selector("xpath=.//strong[contains(@class, 'price')]")
-                if price_elem:
-                    product['price'] = await price_elem.inner_text()
-                else:
-                    if data_log and 'last_discount_price' in data_log:
-                        import json
-                        try:
-                            log_data = json.loads(data_log.replace('&quot;', '"'))
-                            product['price'] = log_data.get('last_discount_price', 'N/A')
-                        except:
-                            product['price'] = "N/A"
-                    else:
-                        product['price'] = "N/A"
+                record['price'] = await price_elem.inner_text() if price_elem else None
 
                 img_elem = await parent.query_selector("xpath=.//img")
                 if img_elem:
-                    product['thumbnail'] = await img_elem.get_attribute('src')
-                    if not product['thumbnail'] or product['thumbnail'] == '':
-                        product['thumbnail'] = await img_elem.get_attribute('data-src')
-                    if not product['thumbnail'] or product['thumbnail'] == '':
-                        product['thumbnail'] = await img_elem.get_attribute('data-original')
-                else:
-                    product['thumbnail'] = "N/A"
-
-                product['registered_date'] = datetime.now().strftime("%Y-%m-%d")
-
+                    record['has_img'] = True
+                    record['src'] = await img_elem.get_attribute('src')
+                    if not record['src']:
+                        record['data_src'] = await img_elem.get_attribute('data-src')
+                        if not record['data_src']:
+                            record['data_original'] = await img_elem.get_attribute('data-original')
+
+                product = build_product(record)
                 products.append(product)
-                self.progress.emit(f"상품 {idx}/{len(product_links)} 처리 완료: {product['name'][:30]}")
+                self.progress.emit(f"{prefix}상품 {idx}/{len(product_links)} 처리 완료: {product['name'][:30]}")
 
             except Exception as e:
-                self.progress.emit(f"상품 {idx} 추출 오류: {str(e)}")
+                self.progress.emit(f"{prefix}상품 {idx} 추출 오류: {str(e)}")
                 continue
 
         return products
 
-    async def download_images(self, products):
-        """썸네일 이미지 다운로드"""
-        img_dir = "thumbnails"
-        if not os.path.exists(img_dir):
-            os.makedirs(img_dir)
+    async def download_worker(self):
+        """다운로드 큐에서 상품을 꺼내 썸네일을 받는 작업자 (None을 받으면 종료)"""
+        while True:
+            product = await self.download_queue.get()
+            if product is None:
+                return
+            if self.is_running:
+                await self.download_image(product)
 
-        for idx, product in enumerate(products, 1):
-            if not self.is_running:
-                break
+    async def download_image(self, product):
+        """썸네일 이미지를 캐시에서 찾고, 오래된 항목은 재검증, 없으면 다운로드해 캐시에 저장"""
+        idx = product['index'] + 1
+        try:
+            if product.get('thumbnail') and product['thumbnail'] != "N/A":
+                # 브라우저가 받은 이미지로 이미 저장된 상품은 요청 없이 완료
+                filename = product.get('thumbnail_local')
+                if filename is None:
+                    filename = await self.fetch_thumbnail(product)
+                    if filename is None:
+                        return
+
+                product['thumbnail_local'] = filename
+                product['thumbnail_display'] = await self.normalize_thumbnail(filename)
+                self.downloaded += 1
+                self.image_ready.emit(product['index'], filename)
+                self.progress.emit(f"이미지 다운로드 {self.downloaded}/{len(self.products)}")
 
-            try:
-                if product.get('thumbnail') and product['thumbnail'] != "N/A":
-                    url = product['thumbnail']
-                    if url.startswith('//'):
-                        url = 'https:' + url
-                    elif url.startswith('/'):
-                        url = 'https://www.11st.co.kr' + url
+        except Exception as e:
+            self.progress.emit(f"이미지 다운로드 오류 ({idx}): {str(e)}")
+
+    async def fetch_thumbnail(self, product):
+        """작은 CDN 변형을 먼저 받고, 실패하면 원래 URL로 받음"""
+        url = normalize_image_url(product['thumbnail'])
+
+        # 원본이 이미 유효한 상태로 캐시돼 있으면(브라우저 재사용 등) 변형을 따로 받지 않음
+        entry = self.thumbnail_cache.lookup(url)
+        if entry and self.thumbnail_cache.is_fresh(entry):
+            self.image_stats['fresh'] += 1
+            product['thumbnail_fetch_url'] = url
+            return self.thumbnail_cache.path_of(entry)
+
+        # 변형 요청이 계속 실패만 하면 이번 실행에서는 더 시도하지 않음
+        variant_disabled = self.image_stats['variant_failed'] >= 10 and not self.image_stats['variant']
+        if self.request_cdn_variants and not variant_disabled:
+            variant_url = thumbnail_variant_url(url)
+            if variant_url != url:
+                try:
+                    filename = await self.cached_or_fetch(variant_url, variant=True)
+                except Exception:
+                    filename = None
+                if filename is not None:
+                    product['thumbnail_fetch_url'] = variant_url
+                    self.image_stats['variant'] += 1
+                    return filename
+                self.image_stats['variant_failed'] += 1
+
+        product['thumbnail_fetch_url'] = url
+        return await self.cached_or_fetch(url)
+
+    async def normalize_thumbnail(self, path):
+        """표시용 RGB 썸네일을 프로세스 풀에서 한 번만 만들어 경로 반환 (실패하면 None)"""
+        display_path = display_path_for(path)
+        if os.path.exists(display_path):
+            return display_path
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(process_pool(), normalize_thumbnail, path, display_path)
+        except Exception as e:
+            self.progress.emit(f"썸네일 변환 오류: {str(e)}")
+            return None
+
+    async def cached_or_fetch(self, url, variant=False):
+        """캐시 경로 반환: 유효하면 그대로, 검증자가 있으면 조건부 요청(ETag/If-Modified-Since),
+        Content-Length만 있으면 HEAD로 크기 비교, 그 외에는 전체 다운로드
+
+        CDN 변형(variant)은 실패하면 원본으로 받으면 되므로 재시도 없이 한 번만 요청하고,
+        리사이즈 서버 오류가 같은 호스트의 원본 요청까지 막지 않도록 서킷 브레이커를 따로 쓴다.
+        """
+        cache = self.thumbnail_cache
+        entry = cache.lookup(url)
+        policy = {}
+        if variant:
+            policy = {'retries': 0, 'breaker_key': f"{urlparse(url).hostname or ''} (축소 이미지)"}
+
+        if entry and cache.is_fresh(entry):
+            self.image_stats['fresh'] += 1
+            return cache.path_of(entry)
+
+        headers = None
+        try:
+            if entry and (entry.get('etag') or entry.get('last_modified')):
+                headers = cache.conditional_headers(entry)
+            elif entry and entry.get('content_length'):
+                head = await self.fetch_policy.run(url, lambda: self.head_attempt(url),
+                                                   lambda: self.downloader.slot(url), **policy)
+                if head.status_code == 200 and head.headers.get('content-length') == entry['content_length']:
+                    cache.mark_validated(entry)
+                    self.image_stats['length_match'] += 1
+                    return cache.path_of(entry)
+
+            status, path = await self.fetch_policy.run(url, lambda: self.fetch_attempt(url, headers),
+                                                       lambda: self.downloader.slot(url), **policy)
+            if status == 304 and entry is not None:
+                cache.mark_validated(entry)
+                self.image_stats['not_modified'] += 1
+                return cache.path_of(entry)
+
+            if status == 200:
+                self.image_stats['full_fetch'] += 1
+                self.image_stats['bytes'] += cache.index[canonical_image_url(url)]['size']
+                return path
+        except (httpx.HTTPError, ValueError, FetchError, asyncio.TimeoutError):
+            if entry is None:
+                raise
+
+        if entry is not None:
+            self.image_stats['stale'] += 1
+            return cache.path_of(entry)
+        return None
+
+    async def head_attempt(self, url):
+        response = await self.downloader.head(url)
+        if response.status_code == 429 or response.status_code >= 500:
+            raise RetryableStatusError(response.status_code)
+        return response
+
+    async def fetch_attempt(self, url, headers):
+        """한 번의 GET 시도: 200이면 캐시에 스트리밍 저장, 429/5xx는 재시도 대상 오류"""
+        async with self.downloader.stream(url, headers=headers) as response:
+            if response.status_code == 200:
+                return 200, await self.thumbnail_cache.put_stream(url, response)
+            if response.status_code == 429 or response.status_code >= 500:
+                raise RetryableStatusError(response.status_code)
+            return response.status_code, None
+
+
+# 엑셀 시트 레이아웃 (export 엔진 공통)
+EXPORT_HEADERS = ["순번", "대표이미지", "상품명", "가격", "썸네일URL", "로컬이미지경로", "카테고리"]
+EXPORT_COLUMN_WIDTHS = {'A': 8, 'B': 20, 'C': 50, 'D': 15, 'E': 60, 'F': 60, 'G': 15}
+EXPORT_IMAGE_SIZE = 100
+EXPORT_ROW_HEIGHT_IMAGE = 75
+EXPORT_ROW_HEIGHT_TEXT = 30
+
+
+# 내보내기 이미지 변환을 프로세스 풀에 미리 맡겨 두는 행 수 (메모리에 쌓이는 변환 결과의 상한)
+EXPORT_PREPARE_WINDOW = 256
+
+
+def encode_export_image(path):
+    """원본 썸네일을 RGB JPEG 바이트로 변환해 (바이트, 크기) 반환 (프로세스 풀에서 실행)"""
+    with PILImage.open(path) as pil_img:
+        pil_img = to_rgb(pil_img)
+        buffer = io.BytesIO()
+        pil_img.save(buffer, 'JPEG', quality=95)
+        return buffer.getvalue(), pil_img.size
+
+
+class StreamingWorksheet(XLSXWorksheet):
+    """이미지 위치 계산에 쓰는 누적 행 높이를 이어서 더하는 xlsxwriter 워크시트
+
+    xlsxwriter는 행 높이가 바뀐 시트에서 이미지마다 0행부터 높이를 다시 더하므로 이미지가 많으면
+    저장 시간이 행 수의 제곱으로 늘어난다. 이미지는 행 순서대로 배치되므로 직전 합계에서 이어 더한다.
+    """
+    _row_offset_cache = (0, 0)
+
+    def _row_offset(self, row):
+        cached_row, offset = self._row_offset_cache
+        if row < cached_row:
+            cached_row, offset = 0, 0
+        for row_id in range(cached_row, row):
+            offset += self._size_row(row_id)
+        self._row_offset_cache = (row, offset)
+        return offset
+
+    def _position_object_pixels(self, col_start, row_start, x1, y1, width, height, anchor):
+        if not self.row_size_changed or y1 < 0:
+            return super()._position_object_pixels(col_start, row_start, x1, y1, width, height, anchor)
+
+        # 기본 행 높이 기준으로 계산하게 한 뒤 절대 y 좌표만 실제 누적 높이로 보정
+        self.row_size_changed = False
+        try:
+            position = super()._position_object_pixels(col_start, row_start, x1, y1, width, height, anchor)
+        finally:
+            self.row_size_changed = True
+        position[9] += self._row_offset(row_start) - self.default_row_pixels * row_start
+        return position
+
+
+class ExportThread(QThread):
+    """상품 목록을 엑셀 파일로 저장하는 작업 스레드 (취소 가능, 행 단위 진행률 보고)
+
+    engine='openpyxl'은 워크북 전체를 메모리에 만든 뒤 저장하고, engine='xlsxwriter'는
+    constant_memory 모드로 행을 디스크에 바로 흘려 쓰므로 행 수와 관계없이 메모리가 일정하다.
+    """
+    progress = pyqtSignal(int, int)
+    log = pyqtSignal(str)
+    saved = pyqtSignal(str)
+    error = pyqtSignal(str)
 
-                    response = requests.get(url, timeout=10)
-                    if response.status_code == 200:
-                        safe_name = "".join(c for c in product['name'][:50] if c.isalnum() or c in (' ', '_'))
-                        filename = f"{img_dir}/{idx}_{safe_name}.jpg"
+    def __init__(self, products, filename, engine='openpyxl'):
+        super().__init__()
+        # 내보내는 동안 새 크롤링이 시작돼도 영향받지 않도록 목록을 복사
+        self.products = list(products)
+        self.filename = filename
+        self.engine = engine
+        self.is_running = True
 
-                        with open(filename, 'wb') as f:
-                            f.write(response.content)
+    def stop(self):
+        """내보내기 취소"""
+        self.is_running = False
 
-                        product['thumbnail_local'] = filename
-                        self.progress.emit(f"이미지 다운로드 {idx}/{len(products)}")
+    def run(self):
+        try:
+            if self.engine == 'xlsxwriter':
+                completed = self.write_streaming()
+            else:
+                completed = self.write_openpyxl()
 
+            if completed:
+                self.saved.emit(self.filename)
+            else:
+                self.log.emit("\n⚠ 엑셀 내보내기를 취소했습니다.")
+
+        except Exception as e:
+            self.error.emit(str(e))
+
+    def prepared_images(self):
+        """행 순서대로 (상품, 이미지, 오류)를 돌려준다. 이미지는 (경로 또는 JPEG 버퍼, 크기)이며 파일이 없으면 None.
+
+        표시용 썸네일이 없는 행은 EXPORT_PREPARE_WINDOW 행 앞까지 프로세스 풀에 변환을 맡겨 두고,
+        워크북에는 순서대로 넘겨 모든 코어가 변환하는 동안 쓰기가 이어지게 한다.
+        """
+        pool = process_pool()
+        pending = deque()
+
+        def submit(product):
+            local_path = product.get('thumbnail_local', '')
+            if not local_path or not os.path.exists(local_path):
+                return None
+            display_path = product.get('thumbnail_display')
+            if display_path and os.path.exists(display_path):
+                # 다운로드 때 만들어 둔 표시용 RGB 썸네일은 변환 없이 바로 삽입
+                return display_path
+            return pool.submit(encode_export_image, local_path)
+
+        def resolve(product, job):
+            try:
+                if job is None:
+                    return product, None, None
+                if isinstance(job, str):
+                    with PILImage.open(job) as pil_img:
+                        return product, (job, pil_img.size), None
+                data, size = job.result()
+                return product, (io.BytesIO(data), size), None
             except Exception as e:
-                self.progress.emit(f"이미지 다운로드 오류 ({idx}): {str(e)}")
+                return product, None, e
+
+        try:
+            for product in self.products:
+                if not self.is_running:
+                    return
+                pending.append((product, submit(product)))
+                if len(pending) >= EXPORT_PREPARE_WINDOW:
+                    yield resolve(*pending.popleft())
+            while pending and self.is_running:
+                yield resolve(*pending.popleft())
+        finally:
+            # 취소되면 아직 시작하지 않은 변환은 버림
+            for _, job in pending:
+                if job is not None and not isinstance(job, str):
+                    job.cancel()
+
+    def write_openpyxl(self):
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "상품 목록"
+
+        # 헤더
+        for col_num, header in enumerate(EXPORT_HEADERS, 1):
+            cell = ws.cell(row=1, column=col_num, value=header)
+            cell.font = Font(bold=True)
+            cell.alignment = Alignment(horizontal='center', vertical='center')
+
+        # 열 너비 설정
+        for column, width in EXPORT_COLUMN_WIDTHS.items():
+            ws.column_dimensions[column].width = width
+
+        # 데이터 및 이미지 삽입
+        total = len(self.products)
+        for idx, (product, image, error) in enumerate(self.prepared_images(), start=1):
+            if not self.is_running:
+                return False
+
+            row_num = idx + 1
+
+            # 순번
+            ws.cell(row=row_num, column=1, value=idx)
+            ws.cell(row=row_num, column=1).alignment = Alignment(horizontal='center', vertical='center')
+
+            # 상품명
+            ws.cell(row=row_num, column=3, value=product.get('name', ''))
+            ws.cell(row=row_num, column=3).alignment = Alignment(vertical='center', wrap_text=True)
+
+            # 가격
+            ws.cell(row=row_num, column=4, value=product.get('price', ''))
+            ws.cell(row=row_num, column=4).alignment = Alignment(horizontal='right', vertical='center')
+
+            # 썸네일URL
+            ws.cell(row=row_num, column=5, value=product.get('thumbnail', ''))
+
+            # 로컬이미지경로
+            local_path = product.get('thumbnail_local', '')
+            ws.cell(row=row_num, column=6, value=local_path)
+
+            # 카테고리
+            ws.cell(row=row_num, column=7, value=product.get('category', ''))
+
+            # 이미지 삽입 (B열)
+            if error is not None:
+                self.log.emit(f"✗ 이미지 삽입 오류 (행 {row_num}): {str(error)}")
+                ws.row_dimensions[row_num].height = EXPORT_ROW_HEIGHT_TEXT
+            elif image:
+                try:
+                    # openpyxl로 이미지 삽입
+                    img = XLImage(image[0])
+                    img.width = EXPORT_IMAGE_SIZE
+                    img.height = EXPORT_IMAGE_SIZE
+
+                    # B열에 이미지 추가
+                    ws.add_image(img, f'B{row_num}')
+
+                    # 행 높이 조정
+                    ws.row_dimensions[row_num].height = EXPORT_ROW_HEIGHT_IMAGE
+
+                    self.log.emit(f"✓ 이미지 삽입: 행 {row_num}")
+
+                except Exception as e:
+                    self.log.emit(f"✗ 이미지 삽입 오류 (행 {row_num}): {str(e)}")
+                    ws.row_dimensions[row_num].height = EXPORT_ROW_HEIGHT_TEXT
+            else:
+                self.log.emit(f"⚠ 이미지 파일 없음 (행 {row_num}): {local_path}")
+                ws.row_dimensions[row_num].height = EXPORT_ROW_HEIGHT_TEXT
+
+            self.progress.emit(idx, total)
+
+        if not self.is_running:
+            return False
+
+        # 엑셀 파일 저장
+        self.log.emit("엑셀 파일 저장 중...")
+        wb.save(self.filename)
+        return True
+
+    def write_streaming(self):
+        """xlsxwriter constant_memory 모드: 행을 순서대로 디스크에 쓰고, 이미지는 파일 경로로 참조해 저장 시 읽음
+
+        변환한 이미지도 내보내기별 임시 폴더에 JPEG로 써 두고 경로로 넘겨 메모리에 쌓이지 않게 한다.
+        """
+        work_dir = tempfile.mkdtemp(prefix='11st_export_')
+        try:
+            return self.write_streaming_to(work_dir)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def write_streaming_to(self, work_dir):
+        wb = xlsxwriter.Workbook(self.filename, {'constant_memory': True})
+        ws = wb.add_worksheet("상품 목록", worksheet_class=StreamingWorksheet)
+
+        header_format = wb.add_format({'bold': True, 'align': 'center', 'valign': 'vcenter'})
+        index_format = wb.add_format({'align': 'center', 'valign': 'vcenter'})
+        name_format = wb.add_format({'valign': 'vcenter', 'text_wrap': True})
+        price_format = wb.add_format({'align': 'right', 'valign': 'vcenter'})
+
+        # 열 너비 설정
+        for column, width in EXPORT_COLUMN_WIDTHS.items():
+            ws.set_column(f'{column}:{column}', width)
+
+        # 헤더
+        ws.write_row(0, 0, EXPORT_HEADERS, header_format)
+
+        # 데이터 및 이미지 삽입 (constant_memory 모드에서는 행 순서대로 써야 함)
+        total = len(self.products)
+        for idx, (product, image, error) in enumerate(self.prepared_images(), start=1):
+            if not self.is_running:
+                return False
+
+            row = idx
+            local_path = product.get('thumbnail_local', '')
+
+            if error is not None:
+                self.log.emit(f"✗ 이미지 삽입 오류 (행 {row + 1}): {str(error)}")
+            elif image:
+                source, (width, height) = image
+                options = {'x_scale': EXPORT_IMAGE_SIZE / width,
+                           'y_scale': EXPORT_IMAGE_SIZE / height}
+                if isinstance(source, io.BytesIO):
+                    # 변환한 이미지는 임시 폴더에 써 두고 저장할 때 xlsxwriter가 읽게 함
+                    stem = os.path.splitext(os.path.basename(local_path))[0]
+                    converted_path = os.path.join(work_dir, f"{stem}.jpg")
+                    with open(converted_path, 'wb') as f:
+                        f.write(source.getbuffer())
+                    source = converted_path
+                image = (source, options)
+            else:
+                self.log.emit(f"⚠ 이미지 파일 없음 (행 {row + 1}): {local_path}")
+
+            ws.set_row(row, EXPORT_ROW_HEIGHT_IMAGE if image else EXPORT_ROW_HEIGHT_TEXT)
+            ws.write_number(row, 0, idx, index_format)
+            ws.write(row, 2, product.get('name', ''), name_format)
+            ws.write(row, 3, product.get('price', ''), price_format)
+            ws.write(row, 4, product.get('thumbnail', ''))
+            ws.write(row, 5, local_path)
+            ws.write(row, 6, product.get('category', ''))
+
+            if image:
+                ws.insert_image(row, 1, *image)
+                self.log.emit(f"✓ 이미지 삽입: 행 {row + 1}")
+
+            self.progress.emit(idx, total)
+
+        if not self.is_running:
+            return False
+
+        # 엑셀 파일 저장
+        self.log.emit("엑셀 파일 저장 중...")
+        wb.close()
+        return True
+
+
+class ProductFilterModel(QAbstractProxyModel):
+    """상품명 검색어와 가격 범위로 ProductTableModel의 행을 거르는 프록시 모델
+
+    보이는 행은 원본 행 번호 리스트(오름차순)로 들고 있다. 검색어가 바뀌면 n-gram 색인으로 다시
+    고르고, 스트리밍으로 행이 추가되면 새 행만 검사해 끝에 붙인다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        self.query = ''
+        self.min_price = None
+        self.max_price = None
+
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        model.rowsInserted.connect(self.source_rows_inserted)
+        model.dataChanged.connect(self.source_data_changed)
+        model.modelReset.connect(self.refilter)
+        self.refilter()
+
+    def set_filter(self, query, min_price=None, max_price=None):
+        self.query = query
+        self.min_price = min_price
+        self.max_price = max_price
+        self.refilter()
+
+    def matching_rows(self, rows):
+        store = self.sourceModel().store
+        return [row for row in rows if store.price_in_range(row, self.min_price, self.max_price)]
+
+    def refilter(self):
+        store = self.sourceModel().store
+        self.beginResetModel()
+        found = store.name_index.search(self.query)
+        self.rows = self.matching_rows(range(len(store)) if found is None else found)
+        self.endResetModel()
+
+    def source_rows_inserted(self, parent, first, last):
+        store = self.sourceModel().store
+        terms = normalize_search_text(self.query).split()
+        rows = self.matching_rows(row for row in range(first, last + 1)
+                                  if store.name_index.matches(row, terms))
+        if rows:
+            start = len(self.rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+            self.rows.extend(rows)
+            self.endInsertRows()
+
+    def source_data_changed(self, top_left, bottom_right, roles=()):
+        first = bisect_left(self.rows, top_left.row())
+        last = bisect_left(self.rows, bottom_right.row() + 1) - 1
+        if first <= last:
+            self.dataChanged.emit(self.index(first, top_left.column()),
+                                  self.index(last, bottom_right.column()), roles)
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or proxy_index.row() >= len(self.rows):
+            return QModelIndex()
+        return self.sourceModel().index(self.rows[proxy_index.row()], proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        row = bisect_left(self.rows, source_index.row())
+        if row == len(self.rows) or self.rows[row] != source_index.row():
+            return QModelIndex()
+        return self.index(row, source_index.column())
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self.rows)) or not (0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.sourceModel().columnCount()
+
+
+# 로그 창 갱신 주기와 보관하는 최대 줄 수 (넘치면 오래된 줄부터 버림)
+LOG_FLUSH_INTERVAL_MS = 100
+LOG_MAX_LINES = 2000
+
+
+class LogChannel:
+    """작업 스레드의 로그 메시지를 모아 두었다가 GUI 타이머가 한 번에 가져가는 버퍼
+
+    작업 스레드 시그널을 DirectConnection으로 post에 연결하면 메시지마다 GUI 이벤트가 쌓이지 않는다.
+    GUI가 따라가지 못할 만큼 쌓이면 오래된 메시지를 버리고 버린 줄 수만 알린다.
+    """
+
+    def __init__(self, max_lines=LOG_MAX_LINES // 2):
+        self.lock = threading.Lock()
+        self.lines = deque(maxlen=max_lines)
+        self.dropped = 0
+
+    def post(self, message):
+        with self.lock:
+            if len(self.lines) == self.lines.maxlen:
+                self.dropped += 1
+            self.lines.append(message)
+
+    def drain(self):
+        with self.lock:
+            lines = list(self.lines)
+            dropped = self.dropped
+            self.lines.clear()
+            self.dropped = 0
+        if dropped:
+            lines.insert(0, f"... 로그 {dropped}줄 생략")
+        return lines
+
+
+# 가격 표기에서 금액 부분 (할인율 "10%"는 제외)
+PRICE_NUMBER_RE = re.compile(r'(?<![\d,])(\d[\d,]*)(?![\d,]|\s*%)')
+
+
+def parse_price(text):
+    """"12,900원" 같은 가격 표기를 정수로 변환 (금액이 없으면 None)"""
+    if isinstance(text, (int, float)):
+        return int(text)
+    match = PRICE_NUMBER_RE.search(text or '')
+    return int(match.group(1).replace(',', '')) if match else None
+
+
+def normalize_search_text(text):
+    """검색용 정규화: 한글 자모를 음절로 합치고(NFC) 대소문자를 무시"""
+    return unicodedata.normalize('NFC', text or '').casefold()
+
+
+class NGramIndex:
+    """상품명 부분 문자열 검색용 n-gram 색인 (한 글자는 unigram, 두 글자 이상은 bigram)
+
+    행은 추가 순서대로 번호를 받으므로 각 posting 리스트는 항상 정렬돼 있다. 검색어의 n-gram 중
+    posting이 가장 짧은 것을 후보로 삼고 정규화한 이름에 검색어가 실제로 들어 있는지 확인한다.
+    """
+
+    def __init__(self):
+        self.texts = []
+        self.postings = {}
+
+    def __len__(self):
+        return len(self.texts)
+
+    @staticmethod
+    def grams(text):
+        grams = set(text)
+        grams.update(text[i:i + 2] for i in range(len(text) - 1))
+        return grams
+
+    def add(self, text):
+        row = len(self.texts)
+        text = normalize_search_text(text)
+        self.texts.append(text)
+        for gram in self.grams(text):
+            self.postings.setdefault(gram, []).append(row)
+        return row
+
+    def clear(self):
+        self.texts.clear()
+        self.postings.clear()
+
+    def candidates(self, term):
+        if len(term) == 1:
+            return self.postings.get(term, [])
+        lists = [self.postings.get(term[i:i + 2], []) for i in range(len(term) - 1)]
+        return min(lists, key=len)
+
+    def matches(self, row, terms):
+        text = self.texts[row]
+        return all(term in text for term in terms)
+
+    def search(self, query):
+        """공백으로 나눈 검색어가 모두 들어 있는 행 번호 목록 (오름차순, 검색어가 없으면 None)"""
+        terms = normalize_search_text(query).split()
+        if not terms:
+            return None
+        candidates = min((self.candidates(term) for term in terms), key=len)
+        return [row for row in candidates if self.matches(row, terms)]
+
+
+class ProductStore:
+    """결과 표에 보이는 값을 열별 리스트로 보관하는 저장소 (셀마다 Qt 객체를 만들지 않음)
+
+    크롤러 스레드가 고치는 상품 dict를 표가 직접 읽지 않도록 GUI 스레드에서 값을 복사해 둔다.
+    검색용 상품명 색인과 숫자로 바꾼 가격도 행을 추가할 때 함께 갱신한다.
+    """
+    KEYS = ('name', 'price', 'thumbnail', 'thumbnail_local', 'category')
+
+    def __init__(self):
+        self.columns = {key: [] for key in self.KEYS}
+        self.prices = []
+        self.name_index = NGramIndex()
+
+    def __len__(self):
+        return len(self.columns['name'])
+
+    def extend(self, products):
+        for key, values in self.columns.items():
+            values.extend(product.get(key, '') for product in products)
+        for product in products:
+            self.prices.append(parse_price(product.get('price')))
+            self.name_index.add(product.get('name', ''))
+
+    def price_in_range(self, row, min_price, max_price):
+        if min_price is None and max_price is None:
+            return True
+        price = self.prices[row]
+        if price is None:
+            return False
+        return (min_price is None or price >= min_price) and (max_price is None or price <= max_price)
+
+    def value(self, row, key):
+        return self.columns[key][row]
+
+    def set_value(self, row, key, value):
+        self.columns[key][row] = value
+
+    def clear(self):
+        for values in self.columns.values():
+            values.clear()
+        self.prices.clear()
+        self.name_index.clear()
+
+
+# 결과 표 썸네일 미리보기 크기, 메모리에 두는 최대 개수, 디코딩 대기열 길이
+PREVIEW_SIZE = QSize(48, 48)
+PREVIEW_CACHE_SIZE = 1000
+PREVIEW_QUEUE_SIZE = 200
+
+
+class PreviewLoader(QObject):
+    """결과 표에 보이는 행의 썸네일을 백그라운드 스레드에서 작은 QImage로 디코딩
+
+    요청은 최근 것부터 처리하고(LIFO), 대기열이 차면 가장 오래된 요청을 버린다. 빠르게 스크롤하면
+    지나간 행의 요청은 버려지고 지금 보이는 행이 먼저 그려진다.
+    """
+    loaded = pyqtSignal(str, QImage)
+
+    def __init__(self, size=PREVIEW_SIZE, queue_size=PREVIEW_QUEUE_SIZE):
+        super().__init__()
+        self.size = size
+        self.queue_size = queue_size
+        self.queue = deque()
+        self.pending = set()
+        self.condition = threading.Condition()
+        self.stopped = False
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def request(self, path):
+        with self.condition:
+            if path in self.pending:
+                return
+            if len(self.queue) >= self.queue_size:
+                dropped = self.queue.pop()
+                self.pending.discard(dropped)
+            self.queue.appendleft(path)
+            self.pending.add(path)
+            self.condition.notify()
+
+    def forget(self, path):
+        """버려진 요청을 다시 받을 수 있도록 표시 해제"""
+        with self.condition:
+            self.pending.discard(path)
+
+    def stop(self):
+        with self.condition:
+            self.stopped = True
+            self.queue.clear()
+            self.condition.notify()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while not self.queue and not self.stopped:
+                    self.condition.wait()
+                if self.stopped:
+                    return
+                path = self.queue.popleft()
+
+            # 다운로드 때 만들어 둔 표시용 썸네일이 있으면 그것을 디코딩 (원본보다 작고 항상 RGB)
+            display_path = display_path_for(path)
+            reader = QImageReader(display_path if os.path.exists(display_path) else path)
+            reader.setAutoTransform(True)
+            source_size = reader.size()
+            if source_size.isValid():
+                reader.setScaledSize(source_size.scaled(self.size, Qt.AspectRatioMode.KeepAspectRatio))
+            self.loaded.emit(path, reader.read())
+
+
+class PixmapCache:
+    """경로별 미리보기 QPixmap LRU 캐시 (GUI 스레드 전용, 디코딩에 실패한 경로는 None으로 기억)"""
+
+    def __init__(self, max_items=PREVIEW_CACHE_SIZE):
+        self.max_items = max_items
+        self.items = OrderedDict()
+
+    def __contains__(self, path):
+        return path in self.items
+
+    def get(self, path):
+        pixmap = self.items.get(path)
+        if path in self.items:
+            self.items.move_to_end(path)
+        return pixmap
+
+    def put(self, path, pixmap):
+        self.items[path] = pixmap
+        self.items.move_to_end(path)
+        while len(self.items) > self.max_items:
+            self.items.popitem(last=False)
+
+
+class ProductTableModel(QAbstractTableModel):
+    """ProductStore를 보여주는 표 모델 (보이는 행만 그리므로 상품 수와 관계없이 가볍다)
+
+    이미지 열은 뷰가 그 셀을 그릴 때 처음 미리보기를 요청하므로 보이는 행의 썸네일만 디코딩한다.
+    """
+    HEADERS = ("순번", "이미지", "상품명", "가격", "썸네일URL", "로컬이미지경로", "카테고리")
+    # 순번/이미지 다음 열부터 ProductStore.KEYS 순서
+    IMAGE_COLUMN = 1
+    FIRST_KEY_COLUMN = 2
+    LOCAL_PATH_COLUMN = FIRST_KEY_COLUMN + ProductStore.KEYS.index('thumbnail_local')
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = ProductStore()
+        self.pixmaps = PixmapCache()
+        # 디코딩을 기다리는 경로별 행 (같은 썸네일을 여러 행이 공유할 수 있음)
+        self.preview_waiting = {}
+        self.preview_loader = PreviewLoader()
+        self.preview_loader.loaded.connect(self.preview_loaded)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.store)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if index.column() == self.IMAGE_COLUMN:
+            return self.preview(index.row()) if role == Qt.ItemDataRole.DecorationRole else None
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if index.column() == 0:
+            return str(index.row() + 1)
+        return self.store.value(index.row(), ProductStore.KEYS[index.column() - self.FIRST_KEY_COLUMN])
+
+    def preview(self, row):
+        """캐시된 미리보기 반환, 없으면 백그라운드 디코딩을 요청하고 None (완료되면 기다린 셀들만 다시 그림)"""
+        path = self.store.value(row, 'thumbnail_local')
+        if not path:
+            return None
+        if path in self.pixmaps:
+            return self.pixmaps.get(path)
+        self.preview_waiting.setdefault(path, set()).add(row)
+        self.preview_loader.request(path)
+        return None
+
+    def preview_loaded(self, path, image):
+        self.preview_loader.forget(path)
+        self.pixmaps.put(path, None if image.isNull() else QPixmap.fromImage(image))
+        for row in sorted(self.preview_waiting.pop(path, ())):
+            # 요청 뒤 표가 초기화됐으면 해당 행은 다른 상품일 수 있음
+            if row < len(self.store) and self.store.value(row, 'thumbnail_local') == path:
+                index = self.index(row, self.IMAGE_COLUMN)
+                self.dataChanged.emit(index, index)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def append(self, products):
+        """상품 묶음을 끝에 추가 (추가된 행만 뷰에 알림)"""
+        if not products:
+            return
+        start = len(self.store)
+        self.beginInsertRows(QModelIndex(), start, start + len(products) - 1)
+        self.store.extend(products)
+        self.endInsertRows()
+
+    def reset(self, products):
+        self.beginResetModel()
+        self.preview_waiting.clear()
+        self.store.clear()
+        self.store.extend(products)
+        self.endResetModel()
+
+    def set_local_path(self, row, local_path):
+        if row < len(self.store):
+            self.store.set_value(row, 'thumbnail_local', local_path)
+            self.dataChanged.emit(self.index(row, self.IMAGE_COLUMN), self.index(row, self.LOCAL_PATH_COLUMN))
 
 
 class MainWindow(QMainWindow):
@@ -235,7 +2634,14 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.products = []
         self.crawler = None
+        self.exporter = None
         self.init_ui()
+        self.warm_up_browser()
+
+    def warm_up_browser(self):
+        """HTTP 우선이 꺼져 있을 때만 브라우저를 미리 시작 (켜져 있으면 브라우저가 필요한 카테고리에서 시작)"""
+        if not self.http_fast_path_input.isChecked():
+            BrowserService.instance().warm_up()
 
     def init_ui(self):
         self.setWindowTitle("11번가 카테고리 크롤러")
@@ -248,10 +2654,16 @@ class MainWindow(QMainWindow):
         # URL 입력
         url_layout = QHBoxLayout()
         url_layout.addWidget(QLabel("카테고리 URL:"))
-        self.url_input = QLineEdit()
+        self.url_input = QPlainTextEdit()
+        self.url_input.setMaximumHeight(80)
         self.url_input.setPlaceholderText(
-            "https://www.11st.co.kr/page/martplus/category?dispCtgr2No=1361105&dispCtgr3No=1361108")
+            "https://www.11st.co.kr/page/martplus/category?dispCtgr2No=1361105&dispCtgr3No=1361108\n"
+            "(여러 카테고리는 한 줄에 하나씩 입력)")
         url_layout.addWidget(self.url_input)
+
+        self.url_file_btn = QPushButton("URL 파일 열기")
+        self.url_file_btn.clicked.connect(self.load_url_file)
+        url_layout.addWidget(self.url_file_btn)
         layout.addLayout(url_layout)
 
         # 버튼들
@@ -268,53 +2680,176 @@ class MainWindow(QMainWindow):
         self.export_btn.clicked.connect(self.export_to_excel)
         self.export_btn.setEnabled(False)
 
+        self.export_engine_input = QComboBox()
+        self.export_engine_input.addItem("일반", 'openpyxl')
+        self.export_engine_input.addItem("대용량 (저메모리)", 'xlsxwriter')
+
+        self.export_cancel_btn = QPushButton("내보내기 취소")
+        self.export_cancel_btn.clicked.connect(self.cancel_export)
+        self.export_cancel_btn.setEnabled(False)
+
+        self.concurrency_input = QSpinBox()
+        self.concurrency_input.setRange(1, 16)
+        self.concurrency_input.setValue(4)
+
+        self.block_profile_input = QComboBox()
+        self.block_profile_input.addItems(list(BLOCK_PROFILES))
+        self.block_profile_input.setCurrentText('default')
+
+        self.extraction_mode_input = QComboBox()
+        self.extraction_mode_input.addItem("화면(DOM)", 'dom')
+        self.extraction_mode_input.addItem("목록 API(JSON)", 'json')
+
+        self.http_fast_path_input = QCheckBox("HTTP 우선 (브라우저 생략)")
+        self.http_fast_path_input.setChecked(True)
+        self.http_fast_path_input.toggled.connect(self.warm_up_browser)
+
+        button_layout.addWidget(QLabel("수집 방식:"))
+        button_layout.addWidget(self.extraction_mode_input)
+        button_layout.addWidget(self.http_fast_path_input)
+        button_layout.addWidget(QLabel("리소스 차단:"))
+        button_layout.addWidget(self.block_profile_input)
+        button_layout.addWidget(QLabel("동시 실행:"))
+        button_layout.addWidget(self.concurrency_input)
         button_layout.addWidget(self.start_btn)
         button_layout.addWidget(self.stop_btn)
+        button_layout.addWidget(self.export_engine_input)
         button_layout.addWidget(self.export_btn)
+        button_layout.addWidget(self.export_cancel_btn)
         layout.addLayout(button_layout)
 
         # 진행 상황
         self.progress_bar = QProgressBar()
         layout.addWidget(self.progress_bar)
 
+        export_progress_layout = QHBoxLayout()
+        export_progress_layout.addWidget(QLabel("엑셀 내보내기:"))
+        self.export_progress_bar = QProgressBar()
+        export_progress_layout.addWidget(self.export_progress_bar)
+        layout.addLayout(export_progress_layout)
+
         # 로그
         layout.addWidget(QLabel("크롤링 로그:"))
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setMaximumHeight(150)
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(LOG_MAX_LINES)
         layout.addWidget(self.log_text)
 
+        # 작업 스레드 로그는 채널에 모았다가 주기적으로 한 번에 표시
+        self.log_channel = LogChannel()
+        self.log_timer = QTimer(self)
+        self.log_timer.timeout.connect(self.flush_log)
+        self.log_timer.start(LOG_FLUSH_INTERVAL_MS)
+
         # 결과 테이블
         layout.addWidget(QLabel("크롤링 결과:"))
-        self.result_table = QTableWidget()
-        self.result_table.setColumnCount(5)
-        self.result_table.setHorizontalHeaderLabels([
-            "순번", "상품명", "가격", "썸네일URL", "로컬이미지경로"
-        ])
+        search_layout = QHBoxLayout()
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("상품명 검색 (공백으로 여러 단어)")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textChanged.connect(self.apply_filter)
+        search_layout.addWidget(self.search_input)
+        search_layout.addWidget(QLabel("가격:"))
+        self.min_price_input = self.price_filter_input("최소")
+        search_layout.addWidget(self.min_price_input)
+        search_layout.addWidget(QLabel("~"))
+        self.max_price_input = self.price_filter_input("최대")
+        search_layout.addWidget(self.max_price_input)
+        self.search_result_label = QLabel()
+        search_layout.addWidget(self.search_result_label)
+        layout.addLayout(search_layout)
+
+        self.result_model = ProductTableModel(self)
+        self.result_filter = ProductFilterModel(self)
+        self.result_filter.setSourceModel(self.result_model)
+        self.result_filter.modelReset.connect(self.update_search_count)
+        self.result_filter.rowsInserted.connect(self.update_search_count)
+        self.result_table = QTableView()
+        self.result_table.setModel(self.result_filter)
+        # 행 높이를 고정해 행 수가 많아도 내용 크기를 다시 계산하지 않음
+        self.result_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.result_table.verticalHeader().setDefaultSectionSize(PREVIEW_SIZE.height() + 4)
+        self.result_table.setIconSize(PREVIEW_SIZE)
+        self.result_table.setWordWrap(False)
         self.result_table.setColumnWidth(0, 50)
-        self.result_table.setColumnWidth(1, 400)
-        self.result_table.setColumnWidth(2, 100)
-        self.result_table.setColumnWidth(3, 200)
+        self.result_table.setColumnWidth(1, PREVIEW_SIZE.width() + 12)
+        self.result_table.setColumnWidth(2, 400)
+        self.result_table.setColumnWidth(3, 100)
         self.result_table.setColumnWidth(4, 200)
+        self.result_table.setColumnWidth(5, 200)
+        self.result_table.setColumnWidth(6, 100)
         layout.addWidget(self.result_table)
 
+    def price_filter_input(self, label):
+        """가격 범위 입력 (0이면 제한 없음)"""
+        spin = QSpinBox()
+        spin.setRange(0, 1_000_000_000)
+        spin.setSingleStep(1000)
+        spin.setGroupSeparatorShown(True)
+        spin.setSpecialValueText(label)
+        spin.setSuffix("원")
+        spin.valueChanged.connect(self.apply_filter)
+        return spin
+
+    def apply_filter(self):
+        self.result_filter.set_filter(self.search_input.text(),
+                                      self.min_price_input.value() or None,
+                                      self.max_price_input.value() or None)
+
+    def update_search_count(self):
+        shown = self.result_filter.rowCount()
+        total = self.result_model.rowCount()
+        self.search_result_label.setText(f"{shown:,} / {total:,}개" if shown != total else f"{total:,}개")
+
+    def load_url_file(self):
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "URL 목록 열기", "", "Text Files (*.txt);;All Files (*)"
+        )
+        if not filename:
+            return
+
+        # 한글 Windows 메모장으로 저장한 목록은 CP949인 경우가 많음
+        for encoding in ('utf-8-sig', 'cp949'):
+            try:
+                with open(filename, encoding=encoding) as f:
+                    self.url_input.setPlainText(f.read())
+                return
+            except UnicodeDecodeError:
+                continue
+            except OSError as e:
+                QMessageBox.critical(self, "오류", f"URL 목록을 열 수 없습니다: {str(e)}")
+                return
+        QMessageBox.warning(self, "경고", "URL 목록 파일의 인코딩을 읽을 수 없습니다 (UTF-8 또는 CP949로 저장해주세요).")
+
     def start_crawling(self):
-        url = self.url_input.text().strip()
-        if not url:
+        urls = [url for url in self.url_input.toPlainText().replace(',', ' ').split() if url]
+        if not urls:
             QMessageBox.warning(self, "경고", "URL을 입력해주세요.")
             return
 
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
         self.export_btn.setEnabled(False)
+        self.log_channel.drain()
         self.log_text.clear()
-        self.result_table.setRowCount(0)
+        self.products = []
+        self.result_model.reset([])
         self.progress_bar.setValue(0)
 
-        self.log_text.append(f"크롤링 시작: {url}")
-
-        self.crawler = CrawlerThread(url)
-        self.crawler.progress.connect(self.update_progress)
+        concurrency = self.concurrency_input.value()
+        if len(urls) == 1:
+            self.log_channel.post(f"크롤링 시작: {urls[0]}")
+        else:
+            self.log_channel.post(f"크롤링 시작: {len(urls)}개 카테고리 (동시 실행 {concurrency})")
+
+        self.crawler = CrawlerThread(urls, concurrency=concurrency,
+                                     block_profile=self.block_profile_input.currentText(),
+                                     extraction_mode=self.extraction_mode_input.currentData(),
+                                     http_fast_path=self.http_fast_path_input.isChecked())
+        self.crawler.progress.connect(self.log_channel.post, Qt.ConnectionType.DirectConnection)
+        self.crawler.batch.connect(self.append_results)
+        self.crawler.image_ready.connect(self.update_image_status)
         self.crawler.result.connect(self.display_results)
         self.crawler.finished.connect(self.crawling_finished)
         self.crawler.error.connect(self.show_error)
@@ -323,37 +2858,57 @@ class MainWindow(QMainWindow):
     def stop_crawling(self):
         if self.crawler and self.crawler.isRunning():
             self.crawler.stop()
-            self.log_text.append("\n⚠ 크롤링을 중지하는 중...")
+            self.log_channel.post("\n⚠ 크롤링을 중지하는 중...")
             self.stop_btn.setEnabled(False)
 
-    def update_progress(self, message):
-        self.log_text.append(message)
+    def flush_log(self):
+        """채널에 쌓인 로그를 한 번에 추가 (타이머에서 주기적으로 호출)"""
+        lines = self.log_channel.drain()
+        if not lines:
+            return
+        self.log_text.appendPlainText('\n'.join(lines))
         self.log_text.verticalScrollBar().setValue(
             self.log_text.verticalScrollBar().maximum()
         )
 
+    def append_results(self, products):
+        """스트리밍으로 받은 상품 묶음을 표 끝에 추가"""
+        self.result_model.append(products)
+        self.products.extend(products)
+
+    def update_image_status(self, row, local_path):
+        self.result_model.set_local_path(row, local_path)
+
     def display_results(self, products):
+        # 스트리밍으로 이미 모든 행이 추가됐으면 표를 다시 만들지 않음
+        if self.result_model.rowCount() != len(products):
+            self.result_model.reset(products)
         self.products = products
-        self.result_table.setRowCount(len(products))
-
-        for row, product in enumerate(products):
-            self.result_table.setItem(row, 0, QTableWidgetItem(str(row + 1)))
-            self.result_table.setItem(row, 1, QTableWidgetItem(product.get('name', '')))
-            self.result_table.setItem(row, 2, QTableWidgetItem(product.get('price', '')))
-            self.result_table.setItem(row, 3, QTableWidgetItem(product.get('thumbnail', '')))
-            self.result_table.setItem(row, 4, QTableWidgetItem(product.get('thumbnail_local', '')))
 
         self.progress_bar.setValue(100)
-        self.log_text.append(f"\n✓ 크롤링 완료! 총 {len(products)}개 상품")
+        self.log_channel.post(f"\n✓ 크롤링 완료! 총 {len(products)}개 상품")
 
     def crawling_finished(self):
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
-        if self.products:
+        if self.products and not (self.exporter and self.exporter.isRunning()):
             self.export_btn.setEnabled(True)
 
+    def closeEvent(self, event):
+        if self.crawler and self.crawler.isRunning():
+            self.crawler.stop()
+            self.crawler.wait(3000)
+        if self.exporter and self.exporter.isRunning():
+            self.exporter.stop()
+            self.exporter.wait()
+        self.result_model.preview_loader.stop()
+        BrowserService.shutdown_instance()
+        shutdown_process_pool()
+        super().closeEvent(event)
+
     def show_error(self, error_msg):
-        self.log_text.append(f"\n✗ 오류: {error_msg}")
+        self.log_channel.post(f"\n✗ 오류: {error_msg}")
+        self.flush_log()
         QMessageBox.critical(self, "오류", error_msg)
 
     def export_to_excel(self):
@@ -367,123 +2922,47 @@ class MainWindow(QMainWindow):
         )
 
         if filename:
-            try:
-                wb = openpyxl.Workbook()
-                ws = wb.active
-                ws.title = "상품 목록"
-
-                # 헤더
-                headers = ["순번", "대표이미지", "상품명", "가격", "썸네일URL", "로컬이미지경로"]
-                for col_num, header in enumerate(headers, 1):
-                    cell = ws.cell(row=1, column=col_num, value=header)
-                    cell.font = Font(bold=True)
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-
-                # 열 너비 설정
-                ws.column_dimensions['A'].width = 8
-                ws.column_dimensions['B'].width = 20
-                ws.column_dimensions['C'].width = 50
-                ws.column_dimensions['D'].width = 15
-                ws.column_dimensions['E'].width = 60
-                ws.column_dimensions['F'].width = 60
-
-                # 데이터 및 이미지 삽입
-                for idx, product in enumerate(self.products, start=1):
-                    row_num = idx + 1
-
-                    # 순번
-                    ws.cell(row=row_num, column=1, value=idx)
-                    ws.cell(row=row_num, column=1).alignment = Alignment(horizontal='center', vertical='center')
-
-                    # 상품명
-                    ws.cell(row=row_num, column=3, value=product.get('name', ''))
-                    ws.cell(row=row_num, column=3).alignment = Alignment(vertical='center', wrap_text=True)
-
-                    # 가격
-                    ws.cell(row=row_num, column=4, value=product.get('price', ''))
-                    ws.cell(row=row_num, column=4).alignment = Alignment(horizontal='right', vertical='center')
-
-                    # 썸네일URL
-                    ws.cell(row=row_num, column=5, value=product.get('thumbnail', ''))
-
-                    # 로컬이미지경로
-                    local_path = product.get('thumbnail_local', '')
-                    ws.cell(row=row_num, column=6, value=local_path)
-
-                    # 이미지 삽입 (B열)
-                    if local_path and os.path.exists(local_path):
-                        try:
-                            # 절대 경로로 변환
-                            abs_local_path = os.path.abspath(local_path)
-
-                            # PIL로 이미지 열어서 RGB로 변환
-                            pil_img = PILImage.open(abs_local_path)
-                            if pil_img.mode in ('RGBA', 'LA', 'P'):
-                                # 흰 배경으로 변환
-                                background = PILImage.new('RGB', pil_img.size, (255, 255, 255))
-                                if pil_img.mode == 'P':
-                                    pil_img = pil_img.convert('RGBA')
-                                background.paste(pil_img, mask=pil_img.split()[-1] if pil_img.mode == 'RGBA' else None)
-                                pil_img = background
-                            elif pil_img.mode != 'RGB':
-                                pil_img = pil_img.convert('RGB')
-
-                            # 임시 파일 경로 (절대 경로)
-                            temp_dir = os.path.dirname(abs_local_path)
-                            temp_filename = f"temp_{idx}_{os.path.basename(abs_local_path)}"
-                            temp_path = os.path.join(temp_dir, temp_filename)
-
-                            # 임시 파일로 저장
-                            pil_img.save(temp_path, 'JPEG', quality=95)
-
-                            # openpyxl로 이미지 삽입
-                            img = XLImage(temp_path)
-                            img.width = 100
-                            img.height = 100
-
-                            # B열에 이미지 추가
-                            ws.add_image(img, f'B{row_num}')
-
-                            # 행 높이 조정
-                            ws.row_dimensions[row_num].height = 75
-
-                            self.log_text.append(f"✓ 이미지 삽입: 행 {row_num}")
-
-                            # 임시 파일 삭제 (워크북 저장 후 삭제하도록 리스트에 저장)
-                            if not hasattr(self, 'temp_files'):
-                                self.temp_files = []
-                            self.temp_files.append(temp_path)
-
-                        except Exception as e:
-                            self.log_text.append(f"✗ 이미지 삽입 오류 (행 {row_num}): {str(e)}")
-                            ws.row_dimensions[row_num].height = 30
-                    else:
-                        self.log_text.append(f"⚠ 이미지 파일 없음 (행 {row_num}): {local_path}")
-                        ws.row_dimensions[row_num].height = 30
-
-                # 엑셀 파일 저장
-                wb.save(filename)
-
-                # 임시 파일 삭제
-                if hasattr(self, 'temp_files'):
-                    for temp_file in self.temp_files:
-                        try:
-                            if os.path.exists(temp_file):
-                                os.remove(temp_file)
-                        except:
-                            pass
-                    self.temp_files = []
-
-                self.log_text.append(f"\n✓ 엑셀 파일 저장 완료: {filename}")
-                QMessageBox.information(self, "성공", f"엑셀 파일이 저장되었습니다.\n{filename}")
-
-            except Exception as e:
-                QMessageBox.critical(self, "오류", f"엑셀 저장 실패: {str(e)}")
-                self.log_text.append(f"\n✗ 상세 오류: {str(e)}")
+            self.export_btn.setEnabled(False)
+            self.export_cancel_btn.setEnabled(True)
+            self.export_progress_bar.setValue(0)
+            self.log_channel.post(f"\n엑셀 내보내기 시작: {len(self.products)}개 상품")
+
+            self.exporter = ExportThread(self.products, filename,
+                                         engine=self.export_engine_input.currentData())
+            self.exporter.progress.connect(self.update_export_progress)
+            self.exporter.log.connect(self.log_channel.post, Qt.ConnectionType.DirectConnection)
+            self.exporter.saved.connect(self.export_saved)
+            self.exporter.error.connect(self.export_failed)
+            self.exporter.finished.connect(self.export_finished)
+            self.exporter.start()
+
+    def cancel_export(self):
+        if self.exporter and self.exporter.isRunning():
+            self.exporter.stop()
+            self.export_cancel_btn.setEnabled(False)
+
+    def update_export_progress(self, done, total):
+        self.export_progress_bar.setMaximum(total)
+        self.export_progress_bar.setValue(done)
+
+    def export_saved(self, filename):
+        self.log_channel.post(f"\n✓ 엑셀 파일 저장 완료: {filename}")
+        self.flush_log()
+        QMessageBox.information(self, "성공", f"엑셀 파일이 저장되었습니다.\n{filename}")
+
+    def export_failed(self, error_msg):
+        self.log_channel.post(f"\n✗ 상세 오류: {error_msg}")
+        self.flush_log()
+        QMessageBox.critical(self, "오류", f"엑셀 저장 실패: {error_msg}")
+
+    def export_finished(self):
+        self.export_cancel_btn.setEnabled(False)
+        self.export_btn.setEnabled(bool(self.products) and not (self.crawler and self.crawler.isRunning()))
 
 
 if __name__ == '__main__':
-    import os
-    port = int(os.environ.get('PORT', 10000))
-    app.run(host='0.0.0.0', port=port, debug=False)
+    app = QApplication(sys.argv)
+    window = MainWindow()
+    window.show()
+    sys.exit(app.exec())
 
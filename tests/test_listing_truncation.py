@@ -0,0 +1,44 @@
+"""HTTP 경로의 목록 잘림 판정 회귀 테스트"""
+import pytest
+
+from main import extract_listing_from_html
+
+
+def category_html(card_count, extra=""):
+    cards = "".join(f"""
+<li>
+  <div class="c-card-item">
+    <a class="c-card-item__anchor" href="https://www.11st.co.kr/products/{1000000 + i}">
+      <span class="sr-only">상품 {i}</span>
+    </a>
+    <strong class="c-card-item__price">{9900 + i:,}</strong>
+    <img src="https://cdn.011st.com/11src/product/{i}.jpg">
+  </div>
+</li>""" for i in range(card_count))
+    return f"<html><body><ul>{cards}</ul>{extra}</body></html>"
+
+
+@pytest.mark.parametrize("card_count, extra", [
+    # 목록과 무관한 작은 전체 수(장바구니, 헤더)가 있어도 더보기 표시나 페이지 크기 검사를 건너뛰지 않음
+    (40, '<a rel="next" href="?page=2">다음</a><script>var cart={"totalCount":2}</script>'),
+    (40, '<div class="header">장바구니 총 1개</div>'),
+    (40, '<script>var cart={"totalCount":2}</script>'),
+    (37, '<button class="btn_more">더보기</button><span>총 3개</span>'),
+    # 카드 수보다 큰 전체 수
+    (37, '<span>총 1,234개</span>'),
+])
+def test_truncated_listing(card_count, extra):
+    products, truncation = extract_listing_from_html(category_html(card_count, extra))
+    assert len(products) == card_count
+    assert truncation is not None
+
+
+@pytest.mark.parametrize("card_count, extra", [
+    (37, ''),
+    (37, '<span>총 37개</span>'),
+    (37, '<script>var cart={"totalCount":2}</script>'),
+])
+def test_complete_listing(card_count, extra):
+    products, truncation = extract_listing_from_html(category_html(card_count, extra))
+    assert len(products) == card_count
+    assert truncation is None